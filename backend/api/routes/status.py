@@ -9,9 +9,13 @@ Provides information about:
 - Application logs
 """
 
+import asyncio
+import json
 import os
 import re
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -19,11 +23,31 @@ import httpx
 from fastapi import APIRouter, Query
 from pydantic import BaseModel
 
-from common.settings import Settings
+from common.settings import Settings, get_settings
+
+settings = get_settings()
 
 status_router = APIRouter(prefix="/status", tags=["status"])
 
 
+def _parse_transcription_services() -> list[str]:
+    """Parse the TRANSCRIPTION_SERVICES JSON list from the environment."""
+    try:
+        return json.loads(os.environ["TRANSCRIPTION_SERVICES"])
+    except (json.JSONDecodeError, KeyError):
+        return ["whisper_local"]
+
+
+# The environment is fixed for the lifetime of the process, so read it once
+_TRANSCRIPTION_SERVICES = _parse_transcription_services()
+_WHISPER_MODEL_SIZE = os.environ.get("WHISPER_MODEL_SIZE", "large-v3-turbo")
+_WHISPER_DEVICE = os.environ.get("WHISPER_DEVICE", "cpu")
+_STORAGE_SERVICE_NAME = os.environ.get("STORAGE_SERVICE_NAME", "local")
+
+# Unhealthy responses are cached for a shorter time so transient failures recover quickly
+STATUS_ERROR_CACHE_TTL_SECONDS = 1.0
+
+
 class ServiceStatus(BaseModel):
     name: str
     status: str  # "healthy", "unhealthy", "unknown"
@@ -75,72 +99,100 @@ class SystemStatusResponse(BaseModel):
     queue: Optional[QueueStatus] = None
 
 
+# Shared client for Ollama probes, so connections are reused between status checks
+_ollama_client: httpx.AsyncClient | None = None
+_ollama_client_lock = asyncio.Lock()
+
+
+async def get_ollama_client() -> httpx.AsyncClient:
+    """Get the shared Ollama HTTP client, creating it on first use."""
+    global _ollama_client
+
+    async with _ollama_client_lock:
+        if _ollama_client is None or _ollama_client.is_closed:
+            _ollama_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(5.0),
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100,
+                    keepalive_expiry=15.0,
+                ),
+            )
+        return _ollama_client
+
+
+async def close_ollama_client() -> None:
+    """Close the shared Ollama HTTP client, if it was created."""
+    global _ollama_client
+
+    async with _ollama_client_lock:
+        if _ollama_client is not None:
+            await _ollama_client.aclose()
+            _ollama_client = None
+
+
 async def check_ollama_status(
     settings: Settings,
+    client: httpx.AsyncClient,
 ) -> tuple[ServiceStatus, list[ModelStatus]]:
     """Check Ollama connectivity and loaded models."""
     models = []
 
     try:
-        ollama_url = settings.ollama_base_url or "http://localhost:11434"
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            # Check if Ollama is running
-            response = await client.get(f"{ollama_url}/api/tags")
-
-            if response.status_code == 200:
-                data = response.json()
-                available_models = {m["name"]: m for m in data.get("models", [])}
-
-                # Check fast model
-                fast_model = settings.fast_llm_model_name
-                if fast_model:
-                    if fast_model in available_models or any(
-                        fast_model in k for k in available_models.keys()
-                    ):
-                        models.append(
-                            ModelStatus(name=fast_model, status="loaded", role="fast")
-                        )
-                    else:
-                        models.append(
-                            ModelStatus(
-                                name=fast_model, status="unavailable", role="fast"
-                            )
-                        )
-
-                # Check best model
-                best_model = settings.best_llm_model_name
-                if best_model and best_model != fast_model:
-                    if best_model in available_models or any(
-                        best_model in k for k in available_models.keys()
-                    ):
-                        models.append(
-                            ModelStatus(name=best_model, status="loaded", role="best")
-                        )
-                    else:
-                        models.append(
-                            ModelStatus(
-                                name=best_model, status="unavailable", role="best"
-                            )
-                        )
-
-                return (
-                    ServiceStatus(
-                        name="Ollama",
-                        status="healthy",
-                        message=f"{len(available_models)} models available",
-                    ),
-                    models,
+        ollama_url = settings.OLLAMA_BASE_URL or "http://localhost:11434"
+        # Check if Ollama is running
+        response = await client.get(f"{ollama_url}/api/tags")
+
+        if response.status_code == 200:
+            data = response.json()
+            available_models = {m["name"]: m for m in data.get("models", [])}
+
+            def is_loaded(model: str) -> bool:
+                # Exact match first, then match tagged names like "llama3.2:latest"
+                return model in available_models or any(
+                    model in name for name in available_models
                 )
-            else:
-                return (
-                    ServiceStatus(
-                        name="Ollama",
-                        status="unhealthy",
-                        message=f"HTTP {response.status_code}",
-                    ),
-                    models,
+
+            # Check fast model
+            fast_model = settings.FAST_LLM_MODEL_NAME
+            if fast_model:
+                models.append(
+                    ModelStatus(
+                        name=fast_model,
+                        status="loaded" if is_loaded(fast_model) else "unavailable",
+                        role="fast",
+                    )
+                )
+
+            # Check best model
+            best_model = settings.BEST_LLM_MODEL_NAME
+            if best_model and best_model != fast_model:
+                models.append(
+                    ModelStatus(
+                        name=best_model,
+                        status="loaded" if is_loaded(best_model) else "unavailable",
+                        role="best",
+                    )
                 )
 
+            return (
+                ServiceStatus(
+                    name="Ollama",
+                    status="healthy",
+                    message=f"{len(available_models)} models available",
+                ),
+                models,
+            )
+        else:
+            return (
+                ServiceStatus(
+                    name="Ollama",
+                    status="unhealthy",
+                    message=f"HTTP {response.status_code}",
+                ),
+                models,
+            )
+
     except httpx.ConnectError:
         return (
             ServiceStatus(
@@ -175,66 +227,50 @@ async def check_database_status() -> ServiceStatus:
         return ServiceStatus(name="Database", status="unhealthy", message=str(e))
 
 
-def get_configuration(settings: Settings) -> ConfigurationInfo:
+@lru_cache(maxsize=1)
+def get_configuration() -> ConfigurationInfo:
     """Get current configuration info."""
     # Detect GPU type
     gpu_type = None
-    whisper_device = os.environ.get("WHISPER_DEVICE", "cpu")
-
-    if whisper_device == "cuda":
+    if _WHISPER_DEVICE == "cuda":
         gpu_type = "NVIDIA CUDA"
-    elif whisper_device == "mps":
+    elif _WHISPER_DEVICE == "mps":
         gpu_type = "Apple Metal"
 
-    # Get transcription services
-    transcription_services = []
-    try:
-        import json
-
-        services_str = os.environ.get("TRANSCRIPTION_SERVICES", '["whisper_local"]')
-        transcription_services = json.loads(services_str)
-    except:
-        transcription_services = ["whisper_local"]
-
     return ConfigurationInfo(
-        environment=settings.environment or "local",
-        whisper_model=os.environ.get("WHISPER_MODEL_SIZE", "large-v3"),
-        whisper_device=whisper_device,
+        environment=settings.ENVIRONMENT or "local",
+        whisper_model=_WHISPER_MODEL_SIZE,
+        whisper_device=_WHISPER_DEVICE,
         gpu_type=gpu_type,
-        storage_service=os.environ.get("STORAGE_SERVICE_NAME", "local"),
-        transcription_services=transcription_services,
+        storage_service=_STORAGE_SERVICE_NAME,
+        transcription_services=_TRANSCRIPTION_SERVICES,
     )
 
 
-@status_router.get("", response_model=SystemStatusResponse)
-async def get_system_status():
-    """
-    Get comprehensive system status.
+# Most recent status response and the monotonic time it expires at
+_status_cache: tuple[float, SystemStatusResponse] | None = None
+_status_cache_lock = asyncio.Lock()
 
-    Returns health status of all services, loaded models, and configuration.
-    """
-    settings = Settings()
 
-    # Check services
-    services = []
+async def build_system_status(settings: Settings) -> SystemStatusResponse:
+    """Check all services and build a fresh status response."""
+    # Check the database and Ollama concurrently, as they are independent
+    db_status, (ollama_status, models) = await asyncio.gather(
+        check_database_status(),
+        check_ollama_status(settings, await get_ollama_client()),
+    )
 
-    # Backend is healthy if we can respond
-    services.append(
+    services = [
+        # Backend is healthy if we can respond
         ServiceStatus(
             name="Backend", status="healthy", message="Running", version="1.0.0"
-        )
-    )
-
-    # Check database
-    db_status = await check_database_status()
-    services.append(db_status)
-
-    # Check Ollama and get models
-    ollama_status, models = await check_ollama_status(settings)
-    services.append(ollama_status)
+        ),
+        db_status,
+        ollama_status,
+    ]
 
     # Get configuration
-    config = get_configuration(settings)
+    config = get_configuration()
 
     return SystemStatusResponse(
         timestamp=datetime.utcnow().isoformat(),
@@ -244,6 +280,38 @@ async def get_system_status():
     )
 
 
+@status_router.get("", response_model=SystemStatusResponse)
+async def get_system_status(
+    refresh: bool = Query(
+        default=False, description="Bypass the cached status and re-check all services"
+    ),
+):
+    """
+    Get comprehensive system status.
+
+    Returns health status of all services, loaded models, and configuration.
+    Responses are cached briefly so that frequent polling doesn't hit the
+    database and Ollama on every request.
+    """
+    global _status_cache
+
+    # Hold the lock while checking so concurrent polls share a single refresh
+    async with _status_cache_lock:
+        if not refresh and _status_cache is not None:
+            expires_at, cached_status = _status_cache
+            if time.monotonic() < expires_at:
+                return cached_status
+
+        status = await build_system_status(settings)
+
+        ttl = settings.STATUS_CACHE_TTL_SECONDS
+        if any(service.status != "healthy" for service in status.services):
+            ttl = min(ttl, STATUS_ERROR_CACHE_TTL_SECONDS)
+        _status_cache = (time.monotonic() + ttl, status)
+
+        return status
+
+
 @status_router.get("/health")
 async def status_health():
     """Simple health check for the status endpoint."""
@@ -335,7 +403,6 @@ async def get_logs(
     Returns log entries from the log file in reverse chronological order (most recent first).
     Supports filtering by log level and searching within log messages.
     """
-    settings = Settings()
     log_file_path = settings.LOG_FILE_PATH
 
     log_path = Path(log_file_path)
@@ -8,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import OAuth2PasswordBearer
 
 from backend.api.routes import router as api_router
+from backend.api.routes.status import close_ollama_client, get_ollama_client
 from backend.cleanup_job import init_cleanup_scheduler
 from common.settings import get_settings
 
@@ -20,10 +21,12 @@ async def lifespan(app_: FastAPI):  # noqa: ARG001
     log.info("Starting up...")
 
     await init_cleanup_scheduler()
+    await get_ollama_client()
 
     yield
 
     log.info("Shutting down...")
+    await close_ollama_client()
 
 
 # init sentry, if used
@@ -17,13 +17,26 @@ Model Details:
 
 import logging
 import tempfile
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 
 import numpy as np
 
+from common.services.exceptions import TranscriptionCancelledError
+
+if TYPE_CHECKING:
+    from resemblyzer import VoiceEncoder
+    from scipy import sparse
+
 logger = logging.getLogger(__name__)
 
+# Voice encoder shared between diarization runs, loaded on first use
+_voice_encoder: "VoiceEncoder | None" = None
+_voice_encoder_lock = threading.Lock()
+
 
 @dataclass
 class SpeakerSegment:
@@ -34,11 +47,49 @@ class SpeakerSegment:
     speaker: str
 
 
+def load_audio(audio_path: Path, sample_rate: int = 16000) -> np.ndarray:
+    """
+    Load an audio file as a mono float32 waveform.
+
+    Decodes with soundfile and resamples with a polyphase filter, which is much
+    faster than librosa.load. Falls back to librosa for formats libsndfile can't
+    decode.
+
+    Args:
+        audio_path: Path to audio file (any format ffmpeg can read)
+        sample_rate: Sample rate to resample the audio to
+
+    Returns:
+        Mono waveform as a float32 array
+    """
+    try:
+        import soundfile as sf
+        from scipy.signal import resample_poly
+
+        wav, native_sample_rate = sf.read(
+            str(audio_path), dtype="float32", always_2d=False
+        )
+    except (ImportError, RuntimeError) as e:
+        import librosa
+
+        logger.debug(f"Falling back to librosa to load {audio_path}: {e}")
+        wav, _ = librosa.load(str(audio_path), sr=sample_rate, mono=True)
+        return wav
+
+    if wav.ndim > 1:
+        wav = wav.mean(axis=1)
+    if native_sample_rate != sample_rate:
+        wav = resample_poly(wav, sample_rate, native_sample_rate).astype(np.float32)
+    return wav
+
+
 def perform_diarization(
     audio_path: Path,
+    wav: np.ndarray | None = None,
     num_speakers: int | None = None,
     min_speakers: int = 2,
     max_speakers: int = 10,
+    cancellation_checker: Callable[[], bool] | None = None,
 ) -> list[SpeakerSegment]:
     """
     Perform speaker diarization on an audio file.
@@ -48,17 +99,25 @@ def perform_diarization(
 
     Args:
         audio_path: Path to audio file (any format ffmpeg can read)
+        wav: The audio already loaded as 16kHz mono samples, to avoid decoding
+            audio_path again. Pauses in it are kept, so segment times are on
+            the same timeline as wav.
         num_speakers: Exact number of speakers if known, otherwise auto-detected
         min_speakers: Minimum speakers for auto-detection
         max_speakers: Maximum speakers for auto-detection
+        cancellation_checker: Function that returns True if diarization should
+            stop. Checked between stages and between embedding batches.
 
     Returns:
         List of SpeakerSegment objects with start, end, and speaker label
+
+    Raises:
+        TranscriptionCancelledError: If the checker reports diarization should stop
     """
     try:
-        from resemblyzer import VoiceEncoder, preprocess_wav
-        from sklearn.cluster import SpectralClustering
-        import librosa
+        from resemblyzer import hparams, normalize_volume, preprocess_wav
+        from sklearn.cluster import SpectralClustering  # noqa: F401
+        import librosa  # noqa: F401
     except ImportError as e:
         logger.error(
             "Required packages not installed. Please install: "
@@ -72,70 +131,79 @@ def perform_diarization(
 
     # Load and preprocess audio
     # Resemblyzer expects 16kHz mono audio
-    wav, sr = librosa.load(str(audio_path), sr=16000, mono=True)
-    wav = preprocess_wav(wav)
+    sr = 16000
+    if wav is None:
+        wav = preprocess_wav(load_audio(audio_path, sample_rate=sr))
+    else:
+        # A preloaded wav has already had its silence removed, and segment
+        # times must stay on its timeline, so only normalise the volume rather
+        # than let preprocess_wav trim pauses out of it
+        wav = normalize_volume(wav, hparams.audio_norm_target_dBFS, increase_only=True)
 
-    # Create voice encoder (downloads model on first use ~50MB)
-    encoder = VoiceEncoder()
+    encoder = get_voice_encoder()
 
     # Segment audio into chunks for embedding extraction
     # Use 1.5 second windows with 0.75 second overlap
     window_size = 1.5  # seconds
     hop_size = 0.75  # seconds
 
-    # Calculate segment boundaries
-    segments = []
-    embeddings = []
-
     window_samples = int(window_size * sr)
     hop_samples = int(hop_size * sr)
 
-    for start_sample in range(0, len(wav) - window_samples, hop_samples):
-        end_sample = start_sample + window_samples
-        segment_wav = wav[start_sample:end_sample]
-
-        # Skip silent segments
-        if np.abs(segment_wav).max() < 0.01:
-            continue
-
-        # Get speaker embedding for this segment
-        embedding = encoder.embed_utterance(segment_wav)
-        embeddings.append(embedding)
-
-        start_time = start_sample / sr
-        end_time = end_sample / sr
-        segments.append(
-            {
-                "start": start_time,
-                "end": end_time,
-            }
-        )
+    # Strided view of the overlapping windows (no copy), one row per window
+    if len(wav) >= window_samples:
+        windows = np.lib.stride_tricks.sliding_window_view(wav, window_samples)[
+            ::hop_samples
+        ]
+    else:
+        windows = np.empty((0, window_samples), dtype=wav.dtype)
 
-    if len(embeddings) < 2:
+    # Find non-silent windows in one vectorised pass. max(max, -min) is the peak
+    # amplitude, without materialising abs() of every overlapping window.
+    peak_amplitude = np.maximum(windows.max(axis=1), -windows.min(axis=1))
+    non_silent = np.flatnonzero(peak_amplitude >= 0.01)
+
+    if len(non_silent) < 2:
         logger.warning("Not enough audio segments for diarization")
         return [SpeakerSegment(start=0, end=len(wav) / sr, speaker="SPEAKER_00")]
 
-    embeddings = np.array(embeddings)
+    # Get speaker embeddings for the non-silent segments
+    embeddings = _embed_windows(
+        encoder,
+        wav,
+        non_silent * hop_samples,
+        window_samples,
+        cancellation_checker=cancellation_checker,
+    )
+
+    segments = [
+        {
+            "start": window_index * hop_samples / sr,
+            "end": (window_index * hop_samples + window_samples) / sr,
+        }
+        for window_index in non_silent
+    ]
+
+    # Build the nearest-neighbour affinity once and share it between all clusterings
+    affinity = _build_affinity(embeddings)
+
+    _check_cancelled(cancellation_checker)
 
     # Determine number of speakers
     if num_speakers is None:
         # Auto-detect using silhouette score
         num_speakers = _estimate_num_speakers(
             embeddings,
+            affinity,
             min_speakers=min_speakers,
             max_speakers=min(max_speakers, len(embeddings)),
         )
 
     logger.info(f"Clustering into {num_speakers} speakers")
+    _check_cancelled(cancellation_checker)
 
     # Perform spectral clustering
-    clustering = SpectralClustering(
-        n_clusters=num_speakers,
-        affinity="nearest_neighbors",
-        n_neighbors=min(10, len(embeddings) - 1),
-        random_state=42,
-    )
-    labels = clustering.fit_predict(embeddings)
+    labels = _spectral_clustering(affinity, num_speakers)
 
     # Merge adjacent segments with same speaker
     speaker_segments = []
@@ -158,47 +226,279 @@ def perform_diarization(
     return merged_segments
 
 
+def get_voice_encoder() -> "VoiceEncoder":
+    """
+    Get the shared voice encoder, loading it on first use.
+
+    The encoder is loaded once per process (downloading the ~50MB model on first
+    ever use) and runs on the GPU if one is available.
+
+    Returns:
+        The resemblyzer voice encoder
+    """
+    global _voice_encoder
+
+    # Hold the lock while loading so concurrent jobs don't load the model twice
+    with _voice_encoder_lock:
+        if _voice_encoder is None:
+            from resemblyzer import VoiceEncoder
+
+            _configure_torch()
+            _voice_encoder = VoiceEncoder()
+        return _voice_encoder
+
+
+@lru_cache(maxsize=1)
+def _configure_torch() -> None:
+    """
+    Configure torch for fast encoder inference, once per process.
+
+    Lets float32 matmuls use TF32 tensor cores on Ampere and newer GPUs, and lets
+    cuDNN pick the fastest kernels for the encoder's fixed input shapes.
+    """
+    import torch
+
+    torch.set_float32_matmul_precision("high")
+    torch.backends.cudnn.benchmark = True
+
+
+def _embed_windows(
+    encoder: "VoiceEncoder",
+    wav: np.ndarray,
+    window_starts: np.ndarray,
+    window_samples: int,
+    batch_size: int = 32,
+    cancellation_checker: Callable[[], bool] | None = None,
+) -> np.ndarray:
+    """
+    Compute speaker embeddings for equal-length windows of a waveform.
+
+    Approximately equal to calling encoder.embed_utterance() on each window.
+    Rather than recomputing the mel frames shared by overlapping windows, the
+    mel spectrogram is computed once for each block of consecutive windows and
+    each window's frames are sliced out of it. Inside the recording a window's
+    last partial therefore sees the audio that follows it, where
+    embed_utterance would see zero padding, so the embeddings differ very
+    slightly. Each block is embedded in one forward pass, so memory stays
+    bounded however long the recording is.
+
+    Args:
+        encoder: Resemblyzer voice encoder
+        wav: Preprocessed 16kHz mono waveform
+        window_starts: Start sample of each window to embed, in ascending order
+        window_samples: Length of each window in samples
+        batch_size: Maximum number of windows to embed per forward pass
+        cancellation_checker: Function that returns True if embedding should
+            stop, checked before each batch
+
+    Returns:
+        Embeddings array of shape (len(window_starts), embedding_size)
+
+    Raises:
+        TranscriptionCancelledError: If the checker reports embedding should stop
+    """
+    import torch
+    from resemblyzer import hparams
+
+    # Every window is the same length, so each splits into the same partial
+    # utterances, given here as mel frame ranges relative to the window start
+    _, mel_slices = encoder.compute_partial_slices(
+        window_samples, rate=1.3, min_coverage=0.75
+    )
+    partial_frames = np.stack(
+        [np.arange(mel_slice.start, mel_slice.stop) for mel_slice in mel_slices]
+    )
+    n_partials, partial_length = partial_frames.shape
+    window_frames = mel_slices[-1].stop
+
+    # Mel frame i is centred on sample i * frame_step
+    frame_step = int(hparams.sampling_rate * hparams.mel_window_step / 1000)
+    start_frames = np.rint(window_starts / frame_step).astype(np.int64)
+
+    # Split the windows into blocks of at most batch_size windows whose frames
+    # overlap, so a block never spans a long stretch of skipped silence
+    gaps = np.flatnonzero(np.diff(start_frames) >= window_frames) + 1
+    blocks = [
+        run[i : i + batch_size]
+        for run in np.split(np.arange(len(window_starts)), gaps)
+        for i in range(0, len(run), batch_size)
+    ]
+
+    # One contiguous buffer, reused to gather each block's partial mels
+    batch_mels = torch.empty(
+        (
+            max(len(block) for block in blocks) * n_partials * partial_length,
+            hparams.mel_n_channels,
+        ),
+        dtype=torch.float32,
+        device=encoder.device,
+    )
+
+    embeddings = np.empty(
+        (len(window_starts), hparams.model_embedding_size), dtype=np.float32
+    )
+
+    for block in blocks:
+        _check_cancelled(cancellation_checker)
+        first_frame = int(start_frames[block[0]])
+        block_mel = _mel_frames(
+            wav, first_frame, int(start_frames[block[-1]]) + window_frames
+        )
+        block_mel = torch.from_numpy(block_mel).to(encoder.device)
+
+        # Frame indices of every partial of every window in the block
+        frame_indices = (
+            start_frames[block, None, None] - first_frame + partial_frames[None]
+        ).reshape(-1)
+        frame_indices = torch.from_numpy(frame_indices).to(encoder.device)
+
+        mels = batch_mels[: len(frame_indices)]
+        with torch.no_grad():
+            torch.index_select(block_mel, 0, frame_indices, out=mels)
+            partial_embeds = (
+                encoder(mels.view(len(block) * n_partials, partial_length, -1))
+                .cpu()
+                .numpy()
+            )
+
+        # Average each window's partial embeddings and L2-normalise
+        raw_embeds = partial_embeds.reshape(len(block), n_partials, -1).mean(axis=1)
+        embeddings[block] = raw_embeds / np.linalg.norm(
+            raw_embeds, axis=1, keepdims=True
+        )
+
+    return embeddings
+
+
+def _check_cancelled(cancellation_checker: Callable[[], bool] | None) -> None:
+    """Raise TranscriptionCancelledError if the checker reports a cancellation."""
+    if cancellation_checker is not None and cancellation_checker():
+        logger.info("Diarization cancelled")
+        msg = "Diarization was cancelled"
+        raise TranscriptionCancelledError(msg)
+
+
+def _mel_frames(wav: np.ndarray, first_frame: int, last_frame: int) -> np.ndarray:
+    """
+    Compute a range of frames of a waveform's mel spectrogram.
+
+    The frames are the same as the matching rows of
+    resemblyzer.audio.wav_to_mel_spectrogram(wav), which zero pads the
+    waveform, with silent frames past the end of the waveform, as
+    embed_utterance pads a window to cover its last partial.
+
+    Args:
+        wav: 16kHz mono waveform
+        first_frame: Index of the first frame to compute
+        last_frame: Index one past the last frame to compute
+
+    Returns:
+        Mel frames of shape (last_frame - first_frame, mel_n_channels)
+    """
+    import librosa
+    from resemblyzer import hparams
+
+    n_fft = int(hparams.sampling_rate * hparams.mel_window_length / 1000)
+    frame_step = int(hparams.sampling_rate * hparams.mel_window_step / 1000)
+
+    # Frame i covers the n_fft samples centred on sample i * frame_step. Slice
+    # out the samples the frames cover and zero pad them past either end.
+    start = first_frame * frame_step - n_fft // 2
+    end = (last_frame - 1) * frame_step - n_fft // 2 + n_fft
+    samples = wav[max(start, 0) : max(min(end, len(wav)), 0)]
+    pad_before = max(-start, 0)
+    samples = np.pad(samples, (pad_before, end - start - pad_before - len(samples)))
+
+    mel = librosa.feature.melspectrogram(
+        y=samples,
+        sr=hparams.sampling_rate,
+        n_fft=n_fft,
+        hop_length=frame_step,
+        n_mels=hparams.mel_n_channels,
+        center=False,
+    )
+    return mel.astype(np.float32).T
+
+
+def _build_affinity(embeddings: np.ndarray) -> "sparse.csr_matrix":
+    """
+    Build the symmetric nearest-neighbour affinity matrix for spectral clustering.
+
+    This is the same affinity SpectralClustering computes for
+    affinity="nearest_neighbors", so it can be computed once and reused.
+
+    Args:
+        embeddings: Speaker embedding vectors
+
+    Returns:
+        Sparse affinity matrix of shape (n_embeddings, n_embeddings)
+    """
+    from sklearn.neighbors import kneighbors_graph
+
+    connectivity = kneighbors_graph(
+        embeddings, n_neighbors=min(10, len(embeddings) - 1), include_self=True
+    )
+    return 0.5 * (connectivity + connectivity.T)
+
+
+def _spectral_clustering(affinity: "sparse.csr_matrix", n_clusters: int) -> np.ndarray:
+    """Cluster a precomputed affinity matrix, returning a label per embedding."""
+    from sklearn.cluster import SpectralClustering
+
+    clustering = SpectralClustering(
+        n_clusters=n_clusters,
+        affinity="precomputed",
+        random_state=42,
+    )
+    return clustering.fit_predict(affinity)
+
+
 def _estimate_num_speakers(
     embeddings: np.ndarray,
+    affinity: "sparse.csr_matrix",
     min_speakers: int = 2,
     max_speakers: int = 10,
 ) -> int:
     """
     Estimate optimal number of speakers using silhouette score.
 
+    Candidate speaker counts are clustered in parallel threads, as each
+    clustering is independent and mostly runs in native code.
+
     Args:
         embeddings: Speaker embedding vectors
+        affinity: Nearest-neighbour affinity matrix from _build_affinity
         min_speakers: Minimum speakers to consider
         max_speakers: Maximum speakers to consider
 
     Returns:
         Estimated number of speakers
     """
-    from sklearn.cluster import SpectralClustering
+    from joblib import Parallel, delayed
     from sklearn.metrics import silhouette_score
 
+    def score_clustering(n_clusters: int) -> float | None:
+        try:
+            labels = _spectral_clustering(affinity, n_clusters)
+            return silhouette_score(embeddings, labels)
+        except Exception as e:
+            logger.debug(f"Clustering with {n_clusters} failed: {e}")
+            return None
+
     best_score = -1
     best_n = min_speakers
 
     max_speakers = min(max_speakers, len(embeddings) - 1)
+    candidates = range(min_speakers, max_speakers + 1)
 
-    for n_clusters in range(min_speakers, max_speakers + 1):
-        try:
-            clustering = SpectralClustering(
-                n_clusters=n_clusters,
-                affinity="nearest_neighbors",
-                n_neighbors=min(10, len(embeddings) - 1),
-                random_state=42,
-            )
-            labels = clustering.fit_predict(embeddings)
-            score = silhouette_score(embeddings, labels)
+    scores = Parallel(n_jobs=-1, backend="threading")(
+        delayed(score_clustering)(n_clusters) for n_clusters in candidates
+    )
 
-            if score > best_score:
-                best_score = score
-                best_n = n_clusters
-        except Exception as e:
-            logger.debug(f"Clustering with {n_clusters} failed: {e}")
-            continue
+    for n_clusters, score in zip(candidates, scores):
+        if score is not None and score > best_score:
+            best_score = score
+            best_n = n_clusters
 
     logger.info(f"Estimated {best_n} speakers (silhouette score: {best_score:.3f})")
     return best_n
@@ -244,6 +544,76 @@ def _merge_consecutive_segments(
     return merged
 
 
+def assign_speakers(
+    transcript_starts: np.ndarray,
+    transcript_ends: np.ndarray,
+    speaker_segments: list[SpeakerSegment],
+) -> list[str]:
+    """
+    Find the speaker for each transcript segment based on diarization.
+
+    Uses overlap-based matching to find the best speaker for each
+    transcript segment. Speaker segments are sorted by start time, so the
+    candidates that can overlap each transcript segment are found with a
+    binary search instead of scanning every speaker segment. The overlaps
+    with every candidate are then computed in one vectorised pass.
+
+    Args:
+        transcript_starts: Start time of each transcript segment, in seconds
+        transcript_ends: End time of each transcript segment, in seconds
+        speaker_segments: List of SpeakerSegment from diarization
+
+    Returns:
+        Speaker label for each transcript segment, "SPEAKER_00" if none overlap
+    """
+    speaker_segments = sorted(speaker_segments, key=lambda s: s.start)
+    speaker_starts = np.fromiter((s.start for s in speaker_segments), dtype=np.float64)
+    speaker_ends = np.fromiter((s.end for s in speaker_segments), dtype=np.float64)
+    speaker_labels = np.array(
+        [s.speaker for s in speaker_segments] + ["SPEAKER_00"], dtype=object
+    )
+    # Latest end time reached by any segment so far. Segments before the first one
+    # whose reach passes a start time can't overlap anything after that time.
+    speaker_reach = np.maximum.accumulate(speaker_ends)
+
+    # Candidate speaker segments for each transcript segment are [first, last)
+    first_candidates = np.searchsorted(speaker_reach, transcript_starts, side="right")
+    last_candidates = np.searchsorted(speaker_starts, transcript_ends, side="left")
+    num_candidates = np.maximum(last_candidates - first_candidates, 0)
+
+    # Flatten every (transcript segment, candidate) pair, grouped by transcript
+    # segment, and compute all their overlaps at once
+    pair_offsets = np.cumsum(num_candidates) - num_candidates
+    pair_transcript = np.repeat(np.arange(len(transcript_starts)), num_candidates)
+    pair_speaker = (
+        first_candidates[pair_transcript]
+        + np.arange(len(pair_transcript))
+        - pair_offsets[pair_transcript]
+    )
+    overlaps = np.minimum(
+        transcript_ends[pair_transcript], speaker_ends[pair_speaker]
+    ) - np.maximum(transcript_starts[pair_transcript], speaker_starts[pair_speaker])
+
+    # Pick the candidate with the largest positive overlap for each transcript
+    # segment, taking the earliest on ties. Segments without one get the
+    # default label at the end of speaker_labels.
+    best_speaker = np.full(len(transcript_starts), len(speaker_segments))
+    has_candidates = num_candidates > 0
+    max_overlaps = np.zeros(len(transcript_starts))
+    if len(overlaps):
+        max_overlaps[has_candidates] = np.maximum.reduceat(
+            overlaps, pair_offsets[has_candidates]
+        )
+    best_pairs = np.flatnonzero(overlaps == max_overlaps[pair_transcript])
+    best_transcript, first_best = np.unique(
+        pair_transcript[best_pairs], return_index=True
+    )
+    best_speaker[best_transcript] = pair_speaker[best_pairs[first_best]]
+    best_speaker[max_overlaps <= 0] = len(speaker_segments)
+
+    return speaker_labels[best_speaker].tolist()
+
+
 def assign_speakers_to_transcript(
     transcript_segments: list[dict],
     speaker_segments: list[SpeakerSegment],
@@ -251,9 +621,6 @@ def assign_speakers_to_transcript(
     """
     Assign speaker labels to transcript segments based on diarization.
 
-    Uses overlap-based matching to find the best speaker for each
-    transcript segment.
-
     Args:
         transcript_segments: List of dicts with 'start_time', 'end_time', 'text'
         speaker_segments: List of SpeakerSegment from diarization
@@ -261,27 +628,15 @@ def assign_speakers_to_transcript(
     Returns:
         Transcript segments with 'speaker' field updated
     """
-    result = []
-
-    for seg in transcript_segments:
-        start = seg.get("start_time", 0)
-        end = seg.get("end_time", 0)
-
-        # Find speaker with maximum overlap
-        best_speaker = "SPEAKER_00"
-        max_overlap = 0
-
-        for speaker_seg in speaker_segments:
-            overlap = min(end, speaker_seg.end) - max(start, speaker_seg.start)
-            if overlap > max_overlap:
-                max_overlap = overlap
-                best_speaker = speaker_seg.speaker
-
-        result.append(
-            {
-                **seg,
-                "speaker": best_speaker,
-            }
-        )
+    transcript_starts = np.fromiter(
+        (seg.get("start_time", 0) for seg in transcript_segments), dtype=np.float64
+    )
+    transcript_ends = np.fromiter(
+        (seg.get("end_time", 0) for seg in transcript_segments), dtype=np.float64
+    )
+    speakers = assign_speakers(transcript_starts, transcript_ends, speaker_segments)
 
-    return result
+    return [
+        {**seg, "speaker": speaker}
+        for seg, speaker in zip(transcript_segments, speakers)
+    ]
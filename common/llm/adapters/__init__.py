@@ -2,7 +2,7 @@
 from .base import ModelAdapter
 
 # Ollama adapter is always available (uses httpx which is a core dependency)
-from .ollama import OllamaModelAdapter
+from .ollama import OllamaModelAdapter, close_ollama_clients
 
 # Cloud adapters are imported lazily to avoid import errors when their SDKs aren't installed
 # These will be imported in client.py only when needed
@@ -10,6 +10,7 @@ from .ollama import OllamaModelAdapter
 __all__ = [
     "ModelAdapter",
     "OllamaModelAdapter",
+    "close_ollama_clients",
 ]
 
 
@@ -1,8 +1,10 @@
-import json
 import logging
+from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import TypeVar
 
 import httpx
+import orjson
 from pydantic import BaseModel
 
 from common.settings import get_settings
@@ -13,6 +15,53 @@ settings = get_settings()
 T = TypeVar("T", bound=BaseModel)
 logger = logging.getLogger(__name__)
 
+# HTTP clients shared between adapter instances, keyed by (base_url, timeout). Chatbots
+# are created per task, so sharing the client lets connections be reused across calls.
+_CLIENT_CACHE: dict[tuple[str, float], httpx.AsyncClient] = {}
+
+# Request bodies are serialised with orjson, so the content type is set explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _get_client(base_url: str, timeout: float) -> httpx.AsyncClient:
+    """Get the shared HTTP client for an Ollama server, creating it if needed."""
+    key = (base_url, timeout)
+    client = _CLIENT_CACHE.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=40,
+                keepalive_expiry=30.0,
+            ),
+        )
+        _CLIENT_CACHE[key] = client
+    return client
+
+
+async def close_ollama_clients() -> None:
+    """Close all shared Ollama HTTP clients."""
+    clients = list(_CLIENT_CACHE.values())
+    _CLIENT_CACHE.clear()
+    for client in clients:
+        await client.aclose()
+
+
+@lru_cache(maxsize=128)
+def _schema_json(response_format: type[BaseModel]) -> str:
+    """Serialise a response model's JSON schema compactly, cached per class."""
+    return orjson.dumps(response_format.model_json_schema()).decode()
+
+
+@lru_cache(maxsize=128)
+def _schema_instruction(response_format: type[BaseModel]) -> str:
+    """Build the JSON schema instruction for a response model, cached per class."""
+    return (
+        f"\n\nYou must respond with valid JSON that matches this schema:\n"
+        f"```json\n{_schema_json(response_format)}\n```"
+    )
+
 
 class OllamaModelAdapter(ModelAdapter):
     """
@@ -38,38 +87,68 @@ class OllamaModelAdapter(ModelAdapter):
         self._base_url = base_url or settings.OLLAMA_BASE_URL
         self._timeout = timeout
         self._kwargs = kwargs
-        self._client = httpx.AsyncClient(timeout=timeout)
+        self._client = _get_client(self._base_url, timeout)
 
     async def chat(self, messages: list[dict[str, str]]) -> str:
         """
         Perform a standard chat completion with the Ollama model.
 
+        The response is streamed and accumulated, so the text is received while
+        it is generated rather than in one block at the end.
+
         Args:
             messages: List of message dicts with 'role' and 'content' keys
 
         Returns:
             The model's text response
         """
+        return "".join([chunk async for chunk in self.chat_stream(messages)])
+
+    async def chat_stream(self, messages: list[dict[str, str]]) -> AsyncIterator[str]:
+        """
+        Perform a streaming chat completion with the Ollama model.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+
+        Yields:
+            Chunks of the model's text response as they are generated
+
+        Raises:
+            RuntimeError: If Ollama reports an error part way through generating
+        """
         url = f"{self._base_url}/api/chat"
 
         payload = {
             "model": self._model,
             "messages": messages,
-            "stream": False,
+            "stream": True,
             "options": {
                 "temperature": self._kwargs.get("temperature", 0.0),
             },
         }
 
         try:
-            response = await self._client.post(url, json=payload)
-            response.raise_for_status()
-            result = response.json()
-            return result["message"]["content"]
+            async with self._client.stream(
+                "POST", url, content=orjson.dumps(payload), headers=_JSON_HEADERS
+            ) as response:
+                response.raise_for_status()
+                # Ollama streams one JSON object per line
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    # Errors after the stream has started come in band, as the
+                    # status code has already been sent
+                    if "error" in chunk:
+                        msg = f"Ollama generation failed: {chunk['error']}"
+                        logger.error(msg)
+                        raise RuntimeError(msg)
+                    yield chunk["message"]["content"]
         except httpx.HTTPError as e:
             logger.error(f"Ollama API error: {e}")
             raise
-        except (KeyError, json.JSONDecodeError) as e:
+        except (KeyError, orjson.JSONDecodeError) as e:
             logger.error(f"Failed to parse Ollama response: {e}")
             raise
 
@@ -92,10 +171,7 @@ class OllamaModelAdapter(ModelAdapter):
         url = f"{self._base_url}/api/chat"
 
         # Add JSON format instruction to the system message
-        json_instruction = (
-            f"\n\nYou must respond with valid JSON that matches this schema:\n"
-            f"```json\n{response_format.model_json_schema()}\n```"
-        )
+        json_instruction = _schema_instruction(response_format)
 
         # Inject JSON instruction into messages
         enhanced_messages = messages.copy()
@@ -127,19 +203,21 @@ class OllamaModelAdapter(ModelAdapter):
         }
 
         try:
-            response = await self._client.post(url, json=payload)
+            response = await self._client.post(
+                url, content=orjson.dumps(payload), headers=_JSON_HEADERS
+            )
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
             content = result["message"]["content"]
 
             # Parse and validate the JSON response
-            parsed_data = json.loads(content)
+            parsed_data = orjson.loads(content)
             return response_format.model_validate(parsed_data)
 
         except httpx.HTTPError as e:
             logger.error(f"Ollama API error: {e}")
             raise
-        except (KeyError, json.JSONDecodeError) as e:
+        except (KeyError, orjson.JSONDecodeError) as e:
             logger.error(f"Failed to parse Ollama response: {e}")
             raise
         except Exception as e:
@@ -147,5 +225,8 @@ class OllamaModelAdapter(ModelAdapter):
             raise
 
     async def close(self):
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """
+        No-op, kept for API compatibility.
+
+        The HTTP client is shared between adapters, use close_ollama_clients() to close it.
+        """
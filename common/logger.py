@@ -1,6 +1,8 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 from i_dot_ai_utilities.logging.structured_logger import StructuredLogger
@@ -12,6 +14,18 @@ DEFAULT_LOG_FILE_PATH = ".data/logs/app.log"
 DEFAULT_LOG_FILE_MAX_BYTES = 5 * 1024 * 1024  # 5MB
 DEFAULT_LOG_FILE_BACKUP_COUNT = 5
 
+# Background listener that writes queued log records to the console and log file
+_log_listener: QueueListener | None = None
+
+
+def _stop_log_listener():
+    """Flush any queued log records and stop the background listener."""
+    global _log_listener
+
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
 
 def setup_logger(
     log_file_path: str | None = None,
@@ -21,11 +35,16 @@ def setup_logger(
     """
     Set up logging with both console and file handlers.
 
+    Records are put on a queue by the root logger and written out by a
+    background thread, so logging calls never block on console or disk I/O.
+
     Args:
         log_file_path: Path to the log file. Defaults to .data/logs/app.log
         log_file_max_bytes: Max size of each log file in bytes. Defaults to 5MB
         log_file_backup_count: Number of backup files to keep. Defaults to 5
     """
+    global _log_listener
+
     # Use environment variables or defaults
     log_file = log_file_path or os.environ.get("LOG_FILE_PATH", DEFAULT_LOG_FILE_PATH)
     max_bytes = log_file_max_bytes or int(
@@ -43,8 +62,9 @@ def setup_logger(
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
 
-    # Clear any existing handlers to avoid duplicates
+    # Clear any existing handlers and listener to avoid duplicates
     root_logger.handlers.clear()
+    _stop_log_listener()
 
     # Create formatter
     formatter = logging.Formatter(
@@ -56,9 +76,10 @@ def setup_logger(
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     # File handler with rotation
+    file_logging_error = None
     try:
         file_handler = RotatingFileHandler(
             log_file,
@@ -68,10 +89,24 @@ def setup_logger(
         )
         file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
-        root_logger.info(f"File logging enabled: {log_file}")
+        handlers.append(file_handler)
     except Exception as e:
-        root_logger.warning(f"Could not set up file logging: {e}")
+        file_logging_error = e
+
+    # Hand records to the console and file handlers on a background thread
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    if file_logging_error is None:
+        root_logger.info(f"File logging enabled: {log_file}")
+    else:
+        root_logger.warning(f"Could not set up file logging: {file_logging_error}")
+
+
+# Flush queued records before the interpreter exits
+atexit.register(_stop_log_listener)
 
 
 def setup_structured_logger(
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 # Base storage service is always available
 from .base import StorageService
 
@@ -5,8 +7,13 @@ from .base import StorageService
 from .local.local import LocalStorageService
 
 
+@lru_cache(maxsize=1)
 def _get_storage_services_map() -> dict:
-    """Lazily build storage services map to avoid importing cloud SDKs when not needed."""
+    """
+    Lazily build storage services map to avoid importing cloud SDKs when not needed.
+
+    The map is built on first use and cached, as the installed SDKs don't change.
+    """
     services = {
         LocalStorageService.name: LocalStorageService,
     }
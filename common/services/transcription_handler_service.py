@@ -34,6 +34,11 @@ logger = logging.getLogger(__name__)
 
 
 class TranscriptionHandlerService:
+    @classmethod
+    async def warmup(cls) -> None:
+        """Load the transcription models before the first job is received."""
+        await transcription_manager.warmup()
+
     @classmethod
     def check_transcription_exists(cls, transcription_id: UUID) -> bool:
         """Check if a transcription still exists in the database (not deleted)."""
@@ -49,6 +49,14 @@ class TranscriptionAdapter(ABC):
         """
         ...
 
+    @classmethod  # noqa: B027
+    async def warmup(cls) -> None:
+        """Prepares the adapter to transcribe, before the first job arrives.
+
+        Adapters that load models locally can override this to load them and run a short clip through them, so the
+        first transcription doesn't pay for model loading and kernel selection. By default this does nothing.
+        """
+
     @classmethod
     @overload
     async def start(cls, audio_file_path_or_recording: Path) -> TranscriptionJobMessageData:
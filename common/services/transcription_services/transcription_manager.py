@@ -103,6 +103,11 @@ class TranscriptionServiceManager:
 
         return adapters
 
+    async def warmup(self) -> None:
+        """Warm up the available adapters, so the first transcription isn't slowed by model loading."""
+        for adapter in self._available_adapters.values():
+            await adapter.warmup()
+
     def select_adaptor(self, duration_seconds: int) -> TranscriptionAdapter:
         for adaptor in self._available_adapters.values():
             if adaptor.max_audio_length >= duration_seconds:
@@ -1,8 +1,15 @@
+import asyncio
 import logging
+import os
+import threading
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Callable
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterator
 from uuid import UUID
 
+import numpy as np
+
 from common.database.postgres_models import Recording
 from common.services.exceptions import TranscriptionCancelledError
 from common.services.transcription_services.adapter import (
@@ -12,9 +19,69 @@ from common.services.transcription_services.adapter import (
 from common.settings import get_settings
 from common.types import DialogueEntry, TranscriptionJobMessageData
 
+if TYPE_CHECKING:
+    from faster_whisper.transcribe import Segment
+
+    from common.audio.diarization import SpeakerSegment
+
+# Import faster-whisper once, when the adapter is registered, rather than on
+# the first transcription
+try:
+    import ctranslate2
+    from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+    from faster_whisper.vad import (
+        SpeechTimestampsMap,
+        VadOptions,
+        get_speech_timestamps,
+    )
+
+    _FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    _FASTER_WHISPER_AVAILABLE = False
+
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Whisper and the diarization encoder both work on 16kHz audio
+WHISPER_SAMPLE_RATE = 16000
+# Whisper transcribes audio in windows of up to 30 seconds
+WHISPER_CHUNK_SECONDS = 30
+
+# Compute types for each device, fastest first. int8 weights halve the memory
+# moved per decoding step, at little cost to accuracy
+WHISPER_COMPUTE_TYPES = {
+    "cuda": ("int8_float16", "int8_bfloat16", "float16", "int8", "float32"),
+    "cpu": ("int8", "int8_float32", "float32"),
+}
+
+
+@lru_cache
+def _supported_compute_types(device: str) -> frozenset[str]:
+    """
+    Get the compute types CTranslate2 can run efficiently on a device.
+
+    Args:
+        device: "cuda" or "cpu"
+
+    Returns:
+        The supported compute types, or an empty set if the device can't be
+        queried, e.g. because no GPU is visible
+    """
+    try:
+        return frozenset(ctranslate2.get_supported_compute_types(device))
+    except (RuntimeError, ValueError) as e:
+        logger.warning(f"Could not query supported compute types for {device}: {e}")
+        return frozenset()
+
+
+@lru_cache(maxsize=1)
+def _diarization_dependencies_installed() -> bool:
+    """Check if the packages diarization needs are installed."""
+    return all(
+        find_spec(package) is not None
+        for package in ("resemblyzer", "librosa", "sklearn")
+    )
+
 
 class WhisperLocalAdapter(TranscriptionAdapter):
     """
@@ -53,6 +120,164 @@ class WhisperLocalAdapter(TranscriptionAdapter):
         """Set a function that returns True if the job should be cancelled."""
         cls._cancellation_checker = checker
 
+    # Loaded Whisper models, keyed by (model_size, device, compute_type), so the
+    # weights are loaded once per process rather than on every transcription
+    _models: dict[tuple[str, str, str], "WhisperModel"] = {}
+    _models_lock = threading.Lock()
+
+    @classmethod
+    def _get_model(cls) -> "WhisperModel":
+        """
+        Get the Whisper model for the current settings, loading it on first use.
+
+        Returns:
+            The cached faster-whisper model
+
+        Raises:
+            ImportError: If faster-whisper is not installed
+        """
+        cls._require_faster_whisper()
+
+        model_size = settings.WHISPER_MODEL_SIZE
+        device = settings.WHISPER_DEVICE  # "cuda" or "cpu"
+        compute_type = cls._select_compute_type(device)
+        key = (model_size, device, compute_type)
+
+        # Hold the lock while loading so concurrent jobs don't load the model twice
+        with cls._models_lock:
+            model = cls._models.get(key)
+            if model is None:
+                logger.info(
+                    f"Loading Whisper model: {model_size} on {device} with {compute_type}"
+                )
+                if device == "cuda" and model_size in ("large", "large-v3"):
+                    logger.warning(
+                        f"Consider WHISPER_MODEL_SIZE=large-v3-turbo instead of {model_size}, "
+                        "for several times faster decoding with similar accuracy"
+                    )
+
+                model_kwargs = {
+                    "device": device,
+                    "compute_type": compute_type,
+                }
+                if device == "cpu":
+                    model_kwargs["cpu_threads"] = (
+                        settings.WHISPER_CPU_THREADS or cls._default_cpu_threads()
+                    )
+                    if settings.WHISPER_NUM_WORKERS is not None:
+                        model_kwargs["num_workers"] = settings.WHISPER_NUM_WORKERS
+                else:
+                    model_kwargs["device_index"] = settings.WHISPER_DEVICE_INDEX
+
+                model = WhisperModel(
+                    model_size,
+                    **model_kwargs,
+                )
+                cls._models[key] = model
+
+        return model
+
+    @classmethod
+    async def warmup(cls) -> None:
+        """
+        Load the models and run a second of silence through them.
+
+        The first run selects kernels and grows the allocators, which would
+        otherwise add several seconds to the first real transcription. Failures
+        are logged rather than raised, as the job will load the models anyway.
+        """
+        if not cls.is_available():
+            return
+
+        logger.info("Warming up Whisper...")
+        try:
+            await asyncio.to_thread(cls._warmup)
+        except Exception as e:
+            logger.warning(f"Whisper warmup failed: {e}")
+        else:
+            logger.info("Whisper warmup complete")
+
+    @classmethod
+    def _warmup(cls) -> None:
+        """Run a second of silence through VAD, Whisper and the voice encoder."""
+        silence = np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32)
+        cls._detect_speech(silence)
+        for _ in cls._transcribe(silence, [{"start": 0, "end": len(silence)}]):
+            pass
+
+        if settings.ENABLE_SPEAKER_DIARIZATION and cls.is_diarization_available():
+            from common.audio.diarization import get_voice_encoder
+
+            get_voice_encoder().embed_utterance(silence)
+
+    @staticmethod
+    def _select_compute_type(device: str) -> str:
+        """
+        Choose the compute type to run Whisper with on a device.
+
+        Uses WHISPER_COMPUTE_TYPE if the device supports it, and otherwise the
+        fastest compute type the device supports, so a GPU gets the int8 tensor
+        core path by default and a misconfigured type doesn't fail the load.
+
+        Args:
+            device: "cuda" or "cpu"
+
+        Returns:
+            The compute type to pass to WhisperModel
+        """
+        preferred = WHISPER_COMPUTE_TYPES.get(device, WHISPER_COMPUTE_TYPES["cpu"])
+        requested = settings.WHISPER_COMPUTE_TYPE
+        supported = _supported_compute_types(device)
+        if not supported:
+            # Leave it to CTranslate2 to report the problem with the device
+            return requested or preferred[0]
+        if requested in supported:
+            return requested
+
+        compute_type = next((t for t in preferred if t in supported), "float32")
+        if requested:
+            logger.warning(
+                f"Compute type {requested} is not supported on {device}, "
+                f"using {compute_type}"
+            )
+        return compute_type
+
+    @staticmethod
+    def _require_faster_whisper() -> None:
+        """
+        Raise an ImportError if faster-whisper is not installed.
+
+        Raises:
+            ImportError: If faster-whisper is not installed
+        """
+        if not _FASTER_WHISPER_AVAILABLE:
+            msg = (
+                "faster-whisper is not installed. "
+                "Please install it: pip install faster-whisper"
+            )
+            raise ImportError(msg)
+
+    @staticmethod
+    def _default_cpu_threads() -> int:
+        """
+        Get the number of CPU threads each Whisper model should use.
+
+        Hyperthreads share a core's matrix units, so a thread per physical core
+        (assumed to be half the logical CPUs) is faster than one per logical
+        CPU. The cores are split between the transcription processes on the node.
+        Only the CPUs this process may run on are counted, so a CPU-limited Ray
+        actor or container isn't oversubscribed.
+
+        Returns:
+            The number of threads, at least 1
+        """
+        if hasattr(os, "sched_getaffinity"):
+            logical_cpus = len(os.sched_getaffinity(0))
+        else:
+            logical_cpus = os.cpu_count() or 2
+        physical_cores = logical_cpus // 2
+        return max(1, physical_cores // settings.MAX_TRANSCRIPTION_PROCESSES)
+
     @classmethod
     async def start(
         cls,
@@ -72,107 +297,300 @@ class WhisperLocalAdapter(TranscriptionAdapter):
             ImportError: If faster-whisper is not installed
             RuntimeError: If transcription fails
         """
+        cls._require_faster_whisper()
+
+        audio_path = cls._get_audio_path(audio_file_path_or_recording)
+        logger.info(f"Starting Whisper transcription for: {audio_path}")
+
+        # Use the passed cancellation checker or fall back to class-level one
+        checker = cancellation_checker or cls._cancellation_checker
+
+        audio, speech = await cls._load_speech(audio_path)
+
+        # Diarize in the background while Whisper transcribes, as diarization
+        # only needs the audio, not the transcript
+        diarization = None
+        stop_diarization = threading.Event()
+        if settings.ENABLE_SPEAKER_DIARIZATION and speech:
+            diarization = asyncio.create_task(
+                cls._diarize(audio_path, audio, speech, stop_diarization.is_set)
+            )
+
+        # Collect the segments as arrays of times and a list of text
+        starts = []
+        ends = []
+        texts = []
         try:
-            from faster_whisper import WhisperModel
-        except ImportError as e:
-            msg = (
-                "faster-whisper is not installed. "
-                "Please install it: pip install faster-whisper"
+            async for segment in cls._stream_segments(audio, speech, checker):
+                starts.append(segment.start)
+                ends.append(segment.end)
+                texts.append(segment.text.strip())
+        except BaseException:
+            if diarization is not None:
+                # Cancelling the task can't stop its thread, so tell diarization
+                # to stop at its next check and wait for the thread to finish,
+                # rather than leave it competing with the next job for the
+                # voice encoder and the CPU/GPU
+                stop_diarization.set()
+                await asyncio.wait([diarization])
+            raise
+        logger.info(f"Transcription complete: {len(texts)} segments")
+        starts = np.array(starts, dtype=np.float64)
+        ends = np.array(ends, dtype=np.float64)
+
+        # Label the segments with the speakers, once diarization finishes
+        speakers = None
+        if diarization is not None:
+            speaker_segments = await diarization
+            if speaker_segments is not None:
+                speakers = cls._assign_speakers(starts, ends, speaker_segments)
+        if speakers is None:
+            speakers = ["Speaker 1"] * len(texts)
+
+        # Convert segments to DialogueEntry format
+        dialogue_entries = [
+            DialogueEntry(speaker=speaker, text=text, start_time=start, end_time=end)
+            for speaker, text, start, end in zip(
+                speakers, texts, starts.tolist(), ends.tolist()
+            )
+        ]
+
+        return TranscriptionJobMessageData(
+            transcription_service=cls.name,
+            transcript=dialogue_entries,
+        )
+
+    @classmethod
+    async def stream(
+        cls,
+        audio_file_path_or_recording: Path | Recording,
+        cancellation_checker: Callable[[], bool] | None = None,
+    ) -> AsyncIterator[DialogueEntry]:
+        """
+        Transcribe audio file using local Whisper model, yielding each segment
+        as soon as it is decoded.
+
+        Diarization needs the whole recording, so every entry is attributed to
+        "Speaker 1". Use start for a diarized transcript.
+
+        Args:
+            audio_file_path_or_recording: Path to audio file or Recording object
+            cancellation_checker: Function that returns True if the job should be
+                cancelled
+
+        Yields:
+            A DialogueEntry for each transcribed segment, in order
+
+        Raises:
+            ImportError: If faster-whisper is not installed
+            TranscriptionCancelledError: If the checker reports the job was cancelled
+        """
+        cls._require_faster_whisper()
+
+        audio_path = cls._get_audio_path(audio_file_path_or_recording)
+        logger.info(f"Starting Whisper transcription stream for: {audio_path}")
+
+        checker = cancellation_checker or cls._cancellation_checker
+        audio, speech = await cls._load_speech(audio_path)
+        async for segment in cls._stream_segments(audio, speech, checker):
+            yield DialogueEntry(
+                speaker="Speaker 1",
+                text=segment.text.strip(),
+                start_time=segment.start,
+                end_time=segment.end,
             )
-            raise ImportError(msg) from e
 
-        # Get the file path
+    @staticmethod
+    def _get_audio_path(audio_file_path_or_recording: Path | Recording) -> Path:
+        """Get the path of the audio file to transcribe."""
         if isinstance(audio_file_path_or_recording, Path):
-            audio_path = audio_file_path_or_recording
-        else:
-            # If Recording object, get the path
-            audio_path = Path(audio_file_path_or_recording.file_path)
+            return audio_file_path_or_recording
+        # If Recording object, get the path
+        return Path(audio_file_path_or_recording.file_path)
 
-        logger.info(f"Starting Whisper transcription for: {audio_path}")
+    @classmethod
+    async def _load_speech(
+        cls, audio_path: Path
+    ) -> tuple[np.ndarray, list[dict[str, int]]]:
+        """
+        Decode an audio file and find the speech in it.
 
-        # Initialize Whisper model
-        model_size = settings.WHISPER_MODEL_SIZE
-        device = settings.WHISPER_DEVICE  # "cuda" or "cpu"
-        compute_type = (
-            settings.WHISPER_COMPUTE_TYPE
-        )  # "float16" for GPU, "int8" for CPU
+        The audio is decoded once and shared between Whisper and diarization,
+        and the speech is found once so both can skip silence. Both steps block
+        for a long time, so run in a thread to keep the event loop responsive.
+
+        Args:
+            audio_path: Path to the audio file
+
+        Returns:
+            The 16kHz mono audio samples and the speech ranges in them
+        """
+        audio = await asyncio.to_thread(cls._decode_audio, audio_path)
+        speech = await asyncio.to_thread(cls._detect_speech, audio)
+        return audio, speech
+
+    @staticmethod
+    def _decode_audio(audio_path: Path) -> np.ndarray:
+        """Decode an audio file to 16kHz mono float32 samples, as Whisper expects."""
+        return decode_audio(str(audio_path), sampling_rate=WHISPER_SAMPLE_RATE)
+
+    @staticmethod
+    def _detect_speech(audio: np.ndarray) -> list[dict[str, int]]:
+        """
+        Find the speech in audio with Silero VAD.
+
+        Args:
+            audio: 16kHz mono audio samples
+
+        Returns:
+            Speech ranges as dicts of "start" and "end" sample indices, each no
+            longer than a Whisper window
+        """
+        speech = get_speech_timestamps(
+            audio,
+            VadOptions(
+                min_silence_duration_ms=500,  # Minimum silence duration to split
+                max_speech_duration_s=WHISPER_CHUNK_SECONDS,
+            ),
+            sampling_rate=WHISPER_SAMPLE_RATE,
+        )
 
+        speech_seconds = (
+            sum(chunk["end"] - chunk["start"] for chunk in speech) / WHISPER_SAMPLE_RATE
+        )
         logger.info(
-            f"Loading Whisper model: {model_size} on {device} with {compute_type}"
+            f"Found {speech_seconds:.0f}s of speech in "
+            f"{len(audio) / WHISPER_SAMPLE_RATE:.0f}s of audio"
         )
+        return speech
 
-        model_kwargs = {
-            "device": device,
-            "compute_type": compute_type,
-        }
-        if device == "cpu":
-            # Only pass thread parameters if they're explicitly set
-            if settings.WHISPER_CPU_THREADS is not None:
-                model_kwargs["cpu_threads"] = settings.WHISPER_CPU_THREADS
-            if settings.WHISPER_NUM_WORKERS is not None:
-                model_kwargs["num_workers"] = settings.WHISPER_NUM_WORKERS
-
-        model = WhisperModel(
-            model_size,
-            **model_kwargs,
+    @staticmethod
+    def _merge_speech(speech: list[dict[str, int]]) -> list[dict[str, float]]:
+        """
+        Merge consecutive speech ranges into clips of up to one Whisper window.
+
+        Whisper pads every clip to a full window, so transcribing each short
+        range separately would waste most of the work.
+
+        Args:
+            speech: Speech ranges as dicts of "start" and "end" sample indices
+
+        Returns:
+            Clips as dicts of "start" and "end" times in seconds
+        """
+        max_samples = WHISPER_CHUNK_SECONDS * WHISPER_SAMPLE_RATE
+        clips: list[dict[str, int]] = []
+        for chunk in speech:
+            if clips and chunk["end"] - clips[-1]["start"] <= max_samples:
+                clips[-1]["end"] = chunk["end"]
+            else:
+                clips.append({"start": chunk["start"], "end": chunk["end"]})
+
+        return [
+            {
+                "start": clip["start"] / WHISPER_SAMPLE_RATE,
+                "end": clip["end"] / WHISPER_SAMPLE_RATE,
+            }
+            for clip in clips
+        ]
+
+    @classmethod
+    def _transcribe(
+        cls, audio: np.ndarray, speech: list[dict[str, int]]
+    ) -> Iterator["Segment"]:
+        """
+        Start transcribing audio with the cached Whisper model. This blocks
+        while the model loads and the audio features are computed, so should be
+        run in a thread.
+
+        Args:
+            audio: 16kHz mono audio samples
+            speech: Speech ranges in the audio, from _detect_speech
+
+        Returns:
+            The transcribed segments. They are decoded lazily, a batch at a time,
+            as they are iterated over.
+        """
+        if not speech:
+            logger.info("No speech detected, skipping transcription")
+            return iter(())
+
+        model = cls._get_model()
+
+        # Transcribe the speech clips in batches, rather than one 30 second
+        # window at a time, to keep the GPU busy
+        batch_size = settings.WHISPER_BATCH_SIZE or (
+            16 if settings.WHISPER_DEVICE == "cuda" else 4
         )
+        pipeline = BatchedInferencePipeline(model=model)
 
         # Transcribe the audio
-        segments, info = model.transcribe(
-            str(audio_path),
+        segments, info = pipeline.transcribe(
+            audio,
+            batch_size=batch_size,
             language="en",  # Can make this configurable
-            beam_size=5,
-            vad_filter=True,  # Voice Activity Detection - removes silence
-            vad_parameters=dict(
-                min_silence_duration_ms=500,  # Minimum silence duration to split
-            ),
+            beam_size=settings.WHISPER_BEAM_SIZE,  # 1 is greedy decoding
+            vad_filter=False,  # Silence is already removed by the clips
+            clip_timestamps=cls._merge_speech(speech),
+            # Decode timestamps, so each clip is split into sentence-level
+            # segments rather than returned as one segment of up to 30 seconds
+            without_timestamps=False,
         )
 
         logger.info(
             f"Detected language: {info.language} with probability {info.language_probability:.2f}"
         )
+        return segments
 
-        # Convert segments to DialogueEntry format
-        # Use the passed cancellation checker or fall back to class-level one
-        checker = cancellation_checker or cls._cancellation_checker
-        dialogue_entries = []
-        segment_count = 0
+    @classmethod
+    async def _stream_segments(
+        cls,
+        audio: np.ndarray,
+        speech: list[dict[str, int]],
+        checker: Callable[[], bool] | None,
+    ) -> AsyncIterator["Segment"]:
+        """
+        Transcribe audio, yielding each segment as soon as it is decoded.
+
+        Decoding runs in a thread, so the event loop stays responsive while
+        Whisper works.
+
+        Args:
+            audio: 16kHz mono audio samples
+            speech: Speech ranges in the audio, from _detect_speech
+            checker: Function that returns True if the job should be cancelled
 
-        for segment in segments:
+        Yields:
+            The transcribed segments, in order
+
+        Raises:
+            TranscriptionCancelledError: If the checker reports the job was cancelled
+        """
+        segments = await asyncio.to_thread(cls._transcribe, audio, speech)
+
+        segment_count = 0
+        while (segment := await asyncio.to_thread(next, segments, None)) is not None:
             # Check for cancellation every 10 segments to avoid too many DB queries
             segment_count += 1
             if checker and segment_count % 10 == 0:
-                if checker():
+                if await asyncio.to_thread(checker):
                     logger.info("Transcription cancelled - job was deleted")
                     raise TranscriptionCancelledError("Transcription was cancelled")
 
-            dialogue_entry: DialogueEntry = {
-                "speaker": "Speaker 1",  # Default, will be updated by diarization
-                "text": segment.text.strip(),
-                "start_time": segment.start,
-                "end_time": segment.end,
-            }
-            dialogue_entries.append(dialogue_entry)
-
-            logger.debug(f"[{segment.start:.2f}s -> {segment.end:.2f}s] {segment.text}")
-
-        logger.info(f"Transcription complete: {len(dialogue_entries)} segments")
-
-        # Apply speaker diarization if enabled
-        if settings.ENABLE_SPEAKER_DIARIZATION:
-            dialogue_entries = await cls._apply_diarization(
-                audio_path, dialogue_entries
+            logger.debug(
+                "[%.2fs -> %.2fs] %s", segment.start, segment.end, segment.text
             )
 
-        return TranscriptionJobMessageData(
-            transcription_service=cls.name,
-            transcript=dialogue_entries,
-        )
+            yield segment
 
     @classmethod
-    async def _apply_diarization(
-        cls, audio_path: Path, dialogue_entries: list[DialogueEntry]
-    ) -> list[DialogueEntry]:
+    async def _diarize(
+        cls,
+        audio_path: Path,
+        audio: np.ndarray,
+        speech: list[dict[str, int]],
+        cancellation_checker: Callable[[], bool] | None = None,
+    ) -> list["SpeakerSegment"] | None:
         """
         Apply speaker diarization to identify different speakers.
 
@@ -181,66 +599,96 @@ class WhisperLocalAdapter(TranscriptionAdapter):
 
         Args:
             audio_path: Path to the audio file
-            dialogue_entries: List of transcribed segments
+            audio: 16kHz mono audio samples, already decoded from audio_path
+            speech: Speech ranges in the audio, from _detect_speech
+            cancellation_checker: Optional callable that returns True if
+                diarization should stop early
 
         Returns:
-            Updated dialogue_entries with speaker labels
+            Speaker segments with times in the recording, or None if
+            diarization failed or was cancelled
         """
         try:
             from common.audio.diarization import (
+                SpeakerSegment,
                 perform_diarization,
-                assign_speakers_to_transcript,
             )
         except ImportError as e:
             logger.warning(
                 f"Diarization dependencies not available: {e}. "
                 "Continuing without speaker identification."
             )
-            return dialogue_entries
+            return None
 
         logger.info("Starting speaker diarization...")
 
         try:
-            # Perform diarization
-            speaker_segments = perform_diarization(
+            # Diarize only the speech, joined end to end
+            speech_audio = np.concatenate(
+                [audio[chunk["start"] : chunk["end"]] for chunk in speech]
+            )
+
+            # Perform diarization in a thread, as it is CPU/GPU bound
+            speaker_segments = await asyncio.to_thread(
+                perform_diarization,
                 audio_path,
+                wav=speech_audio,
                 num_speakers=settings.DIARIZATION_NUM_SPEAKERS,
                 min_speakers=settings.DIARIZATION_MIN_SPEAKERS,
                 max_speakers=settings.DIARIZATION_MAX_SPEAKERS,
+                cancellation_checker=cancellation_checker,
             )
 
-            # Assign speakers to transcript segments
-            updated_entries = assign_speakers_to_transcript(
-                dialogue_entries, speaker_segments
-            )
-
-            # Convert back to DialogueEntry format with proper speaker labels
-            result = []
-            for entry in updated_entries:
-                # Convert SPEAKER_00 format to more readable format
-                speaker_num = entry["speaker"].split("_")[-1]
-                result.append(
-                    DialogueEntry(
-                        speaker=f"Speaker {int(speaker_num) + 1}",
-                        text=entry["text"],
-                        start_time=entry["start_time"],
-                        end_time=entry["end_time"],
-                    )
+            # Map speaker segments from the joined speech back to recording times
+            time_map = SpeechTimestampsMap(speech, WHISPER_SAMPLE_RATE)
+            return [
+                SpeakerSegment(
+                    start=time_map.get_original_time(segment.start),
+                    end=time_map.get_original_time(segment.end, is_end=True),
+                    speaker=segment.speaker,
                 )
+                for segment in speaker_segments
+            ]
 
-            # Count unique speakers
-            unique_speakers = set(e["speaker"] for e in result)
-            logger.info(
-                f"Diarization complete: {len(unique_speakers)} speakers identified"
-            )
-
-            return result
+        except TranscriptionCancelledError:
+            return None
 
         except Exception as e:
             logger.error(
                 f"Diarization failed: {e}. Continuing without speaker identification."
             )
-            return dialogue_entries
+            return None
+
+    @staticmethod
+    def _assign_speakers(
+        starts: np.ndarray,
+        ends: np.ndarray,
+        speaker_segments: list["SpeakerSegment"],
+    ) -> list[str]:
+        """
+        Label each transcribed segment with the speaker who talks most during it.
+
+        Args:
+            starts: Start time of each transcribed segment, in seconds
+            ends: End time of each transcribed segment, in seconds
+            speaker_segments: Speaker segments from _diarize
+
+        Returns:
+            Speaker label for each segment, e.g. "Speaker 1"
+        """
+        from common.audio.diarization import assign_speakers
+
+        raw_speakers = assign_speakers(starts, ends, speaker_segments)
+
+        # Convert SPEAKER_00 format to more readable format, parsing each
+        # distinct label once rather than once per segment
+        label_map = {
+            label: f"Speaker {int(label.rsplit('_', 1)[-1]) + 1}"
+            for label in set(raw_speakers)
+        }
+        logger.info(f"Diarization complete: {len(label_map)} speakers identified")
+
+        return [label_map[label] for label in raw_speakers]
 
     @classmethod
     def is_available(cls) -> bool:
@@ -250,29 +698,21 @@ class WhisperLocalAdapter(TranscriptionAdapter):
         Returns:
             True if faster-whisper can be imported, False otherwise
         """
-        try:
-            import faster_whisper  # noqa: F401
-
-            return True
-        except ImportError:
+        if not _FASTER_WHISPER_AVAILABLE:
             logger.warning(
                 "faster-whisper not available. Install with: pip install faster-whisper"
             )
-            return False
+        return _FASTER_WHISPER_AVAILABLE
 
     @classmethod
     def is_diarization_available(cls) -> bool:
         """
         Check if speaker diarization is available.
 
+        Looks the packages up without importing them, as resemblyzer imports
+        torch, which takes seconds to load.
+
         Returns:
-            True if resemblyzer and dependencies can be imported
+            True if resemblyzer and dependencies are installed
         """
-        try:
-            import resemblyzer  # noqa: F401
-            import librosa  # noqa: F401
-            from sklearn.cluster import SpectralClustering  # noqa: F401
-
-            return True
-        except ImportError:
-            return False
+        return _diarization_dependencies_installed()
@@ -154,25 +154,42 @@ class Settings(BaseSettings):
 
     # if using local Whisper transcription
     WHISPER_MODEL_SIZE: str = Field(
-        description="Whisper model size: tiny, base, small, medium, large-v2, large-v3",
-        default="large-v3",
+        description="Whisper model size: tiny, base, small, medium, large-v2, large-v3, large-v3-turbo. large-v3-turbo "
+        "has 4 decoder layers instead of 32, so decodes several times faster than large-v3 with similar accuracy",
+        default="large-v3-turbo",
     )
     WHISPER_DEVICE: str = Field(
         description="Device to run Whisper on: 'cuda' for GPU, 'cpu' for CPU",
         default="cuda",
     )
-    WHISPER_COMPUTE_TYPE: str = Field(
-        description="Compute type for Whisper: 'float16' for GPU, 'int8' for CPU, 'float32' for compatibility",
-        default="float16",
+    WHISPER_COMPUTE_TYPE: str | None = Field(
+        description="Compute type for Whisper: 'int8_float16' or 'float16' for GPU, 'int8' for CPU, 'float32' for "
+        "compatibility. Defaults to 'int8_float16' on GPU and 'int8' on CPU, and falls back to the fastest type the "
+        "device supports if it doesn't support this one",
+        default=None,
+    )
+    WHISPER_DEVICE_INDEX: int = Field(
+        description="Index of the GPU to run Whisper on when using 'cuda'",
+        default=0,
     )
     WHISPER_CPU_THREADS: int | None = Field(
-        description="CPU thread count for Whisper when running on CPU",
+        description="CPU thread count for Whisper when running on CPU. Defaults to the physical cores shared between "
+        "the transcription processes",
         default=None,
     )
     WHISPER_NUM_WORKERS: int | None = Field(
         description="Worker count for Whisper when running on CPU",
         default=None,
     )
+    WHISPER_BEAM_SIZE: int = Field(
+        description="Beam size for Whisper decoding. 1 is greedy decoding, which is several times faster than beam "
+        "search with little loss of accuracy on VAD-split audio",
+        default=1,
+    )
+    WHISPER_BATCH_SIZE: int | None = Field(
+        description="Number of audio chunks Whisper transcribes per batch. Defaults to 16 on GPU and 4 on CPU",
+        default=None,
+    )
 
     # Speaker diarization settings (local, no external accounts required)
     ENABLE_SPEAKER_DIARIZATION: bool = Field(
@@ -279,6 +296,12 @@ class Settings(BaseSettings):
         description="Number of backup log files to keep",
     )
 
+    # Status endpoint settings
+    STATUS_CACHE_TTL_SECONDS: float = Field(
+        default=5.0,
+        description="How long a healthy /status response is cached for, to absorb dashboard polling",
+    )
+
     # use a dotenv file for local development
     if dotenv_detected:
         model_config = SettingsConfigDict(env_file=DOT_ENV_PATH, extra="ignore")
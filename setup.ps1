@@ -37,7 +37,7 @@ $SmallWhisper = "medium"
 
 $LargeFastModel = "llama3.2"
 $LargeBestModel = "qwen2.5:32b"
-$LargeWhisper = "large-v3"
+$LargeWhisper = "large-v3-turbo"
 
 # =============================================================================
 # Utility Functions
@@ -397,7 +397,7 @@ function Select-Configuration {
     Write-Host ""
     Write-ColorOutput "      [L] Large - Best quality, requires more resources" -Color Cyan
     Write-Host "          * LLM: qwen2.5:32b (~20GB)"
-    Write-Host "          * Whisper: large-v3 (~3GB)"
+    Write-Host "          * Whisper: large-v3-turbo (~1.6GB)"
     Write-Host ""
     
     $defaultKey = if ($recommended -eq "large") { "L" } else { "S" }
@@ -433,7 +433,7 @@ function New-EnvFile {
     
     if ($script:GPUType -eq "cuda") {
         $whisperDevice = "cuda"
-        $whisperCompute = "float16"
+        $whisperCompute = "int8_float16"
     }
     
     $timestamp = Get-Date -Format "yyyy-MM-dd HH:mm:ss"
@@ -39,7 +39,7 @@ SMALL_WHISPER="medium"
 
 LARGE_FAST_MODEL="llama3.2"
 LARGE_BEST_MODEL="qwen2.5:32b"
-LARGE_WHISPER="large-v3"
+LARGE_WHISPER="large-v3-turbo"
 
 # Parse arguments
 AUTO_MODE=false
@@ -375,7 +375,7 @@ select_configuration() {
     echo ""
     echo -e "      ${CYAN}[L]${NC} Large - Best quality, requires more resources"
     echo -e "          • LLM: qwen2.5:32b (~20GB)"
-    echo -e "          • Whisper: large-v3 (~3GB)"
+    echo -e "          • Whisper: large-v3-turbo (~1.6GB)"
     echo ""
     
     local default_key="s"
@@ -418,7 +418,7 @@ generate_env_file() {
     
     if [[ "$GPU_TYPE" == "cuda" ]]; then
         whisper_device="cuda"
-        whisper_compute="float16"
+        whisper_compute="int8_float16"
     fi
     
     cat > "$ENV_FILE" << EOF
@@ -0,0 +1,248 @@
+import random
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from common.audio import diarization
+from common.audio.diarization import SpeakerSegment, assign_speakers_to_transcript, load_audio
+from common.services.exceptions import TranscriptionCancelledError
+
+
+def assign_speakers_brute_force(transcript_segments: list[dict], speaker_segments: list[SpeakerSegment]) -> list[str]:
+    speakers = []
+    for seg in transcript_segments:
+        best_speaker, max_overlap = "SPEAKER_00", 0
+        for speaker_seg in speaker_segments:
+            overlap = min(seg["end_time"], speaker_seg.end) - max(seg["start_time"], speaker_seg.start)
+            if overlap > max_overlap:
+                best_speaker, max_overlap = speaker_seg.speaker, overlap
+        speakers.append(best_speaker)
+    return speakers
+
+
+def test_assign_speakers_picks_largest_overlap():
+    speaker_segments = [
+        SpeakerSegment(start=0.0, end=4.0, speaker="SPEAKER_00"),
+        SpeakerSegment(start=3.0, end=10.0, speaker="SPEAKER_01"),
+        SpeakerSegment(start=9.5, end=12.0, speaker="SPEAKER_00"),
+    ]
+    transcript_segments = [
+        {"speaker": "Speaker 1", "text": "hello", "start_time": 0.5, "end_time": 3.5},
+        {"speaker": "Speaker 1", "text": "there", "start_time": 3.5, "end_time": 9.0},
+        {"speaker": "Speaker 1", "text": "again", "start_time": 9.8, "end_time": 11.0},
+        {"speaker": "Speaker 1", "text": "silence", "start_time": 20.0, "end_time": 21.0},
+    ]
+
+    result = assign_speakers_to_transcript(transcript_segments, speaker_segments)
+
+    assert [seg["speaker"] for seg in result] == ["SPEAKER_00", "SPEAKER_01", "SPEAKER_00", "SPEAKER_00"]
+    assert [seg["text"] for seg in result] == ["hello", "there", "again", "silence"]
+
+
+def test_assign_speakers_matches_brute_force():
+    rng = random.Random(42)
+    speaker_segments = []
+    time = 0.0
+    for _ in range(200):
+        start = time + rng.uniform(-0.75, 1.0)
+        end = start + rng.uniform(0.5, 8.0)
+        speaker_segments.append(SpeakerSegment(start=start, end=end, speaker=f"SPEAKER_{rng.randrange(4):02d}"))
+        time = end
+    transcript_segments = []
+    for _ in range(300):
+        start = rng.uniform(0, time)
+        transcript_segments.append(
+            {"speaker": "Speaker 1", "text": "", "start_time": start, "end_time": start + rng.uniform(0.1, 10.0)}
+        )
+
+    result = assign_speakers_to_transcript(transcript_segments, speaker_segments)
+
+    assert [seg["speaker"] for seg in result] == assign_speakers_brute_force(transcript_segments, speaker_segments)
+
+
+def test_assign_speakers_prefers_earliest_speaker_on_ties():
+    speaker_segments = [
+        SpeakerSegment(start=2.0, end=4.0, speaker="SPEAKER_01"),
+        SpeakerSegment(start=0.0, end=2.0, speaker="SPEAKER_02"),
+    ]
+    transcript_segments = [
+        {"speaker": "Speaker 1", "text": "hello", "start_time": 1.0, "end_time": 3.0},
+        {"speaker": "Speaker 1", "text": "there", "start_time": 2.0, "end_time": 2.0},
+    ]
+
+    result = assign_speakers_to_transcript(transcript_segments, speaker_segments)
+
+    assert [seg["speaker"] for seg in result] == ["SPEAKER_02", "SPEAKER_00"]
+
+
+def test_assign_speakers_without_speaker_segments():
+    transcript_segments = [{"speaker": "Speaker 1", "text": "hello", "start_time": 0.0, "end_time": 1.0}]
+
+    result = assign_speakers_to_transcript(transcript_segments, [])
+
+    assert result[0]["speaker"] == "SPEAKER_00"
+
+
+def make_speaker_embeddings(n_speakers: int, n_per_speaker: int = 20) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    centres = rng.standard_normal((n_speakers, 256))
+    embeddings = np.repeat(centres, n_per_speaker, axis=0) + 0.3 * rng.standard_normal(
+        (n_speakers * n_per_speaker, 256)
+    )
+    return embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+
+@pytest.mark.parametrize("n_clusters", [2, 3, 4])
+def test_precomputed_affinity_matches_nearest_neighbors_clustering(n_clusters):
+    sklearn_cluster = pytest.importorskip("sklearn.cluster")
+    embeddings = make_speaker_embeddings(3)
+
+    labels = diarization._spectral_clustering(diarization._build_affinity(embeddings), n_clusters)  # noqa: SLF001
+
+    expected = sklearn_cluster.SpectralClustering(
+        n_clusters=n_clusters, affinity="nearest_neighbors", random_state=42
+    ).fit_predict(embeddings)
+    np.testing.assert_array_equal(labels, expected)
+
+
+def test_estimate_num_speakers():
+    pytest.importorskip("sklearn")
+    embeddings = make_speaker_embeddings(3)
+
+    affinity = diarization._build_affinity(embeddings)  # noqa: SLF001
+
+    num_speakers = diarization._estimate_num_speakers(embeddings, affinity, min_speakers=2, max_speakers=6)  # noqa: SLF001
+
+    assert num_speakers == 3
+
+
+def test_load_audio_resamples_to_mono(tmp_path):
+    sf = pytest.importorskip("soundfile")
+    native_sample_rate = 44100
+    t = np.arange(native_sample_rate * 2) / native_sample_rate
+    tone = 0.5 * np.sin(2 * np.pi * 440 * t)
+    audio_path = tmp_path / "stereo.wav"
+    sf.write(audio_path, np.stack([tone, tone], axis=1), native_sample_rate)
+
+    wav = load_audio(audio_path, sample_rate=16000)
+
+    assert wav.dtype == np.float32
+    assert wav.shape == (32000,)
+    assert np.abs(wav).max() == pytest.approx(0.5, abs=0.01)
+
+
+def test_embed_windows_matches_embed_utterance():
+    resemblyzer = pytest.importorskip("resemblyzer")
+    encoder = resemblyzer.VoiceEncoder("cpu")
+    rng = np.random.default_rng(0)
+    t = np.arange(168000) / 16000
+    pitch = 150 + 50 * np.sin(2 * np.pi * 0.5 * t)
+    wav = (0.3 * np.sin(2 * np.pi * pitch * t) + 0.05 * rng.standard_normal(len(t))).astype(np.float32)
+    window_samples, hop_samples = 24000, 12000
+    window_starts = np.arange(0, len(wav) - window_samples + 1, hop_samples)
+    # The final window ends with the recording, so its last partial is zero padded
+    assert window_starts[-1] + window_samples == len(wav)
+
+    embeddings = diarization._embed_windows(encoder, wav, window_starts, window_samples, batch_size=4)  # noqa: SLF001
+
+    expected = np.array([encoder.embed_utterance(wav[start : start + window_samples]) for start in window_starts])
+    similarity = (embeddings * expected).sum(axis=1)
+    assert embeddings.shape == expected.shape
+    assert similarity.min() > 0.99
+    assert similarity[-1] == pytest.approx(1, abs=1e-3)
+
+
+def stub_resemblyzer(mocker):
+    mocker.patch.dict(
+        "sys.modules",
+        {
+            "resemblyzer": SimpleNamespace(
+                hparams=SimpleNamespace(audio_norm_target_dBFS=-30),
+                normalize_volume=lambda wav, *args, **kwargs: wav,  # noqa: ARG005
+                preprocess_wav=lambda wav: wav,
+            )
+        },
+    )
+
+
+def test_diarization_windows_skip_silence(mocker):
+    pytest.importorskip("sklearn")
+    stub_resemblyzer(mocker)
+    mocker.patch.object(diarization, "get_voice_encoder")
+    rng = np.random.default_rng(0)
+    speakers = rng.standard_normal((2, 256))
+    embed_windows = mocker.patch.object(
+        diarization,
+        "_embed_windows",
+        return_value=speakers[[0, 0, 1, 1, 1]] + 0.01 * rng.standard_normal((5, 256)),
+    )
+    # 6 seconds of tone, silent from 1.5s to 3.75s, so the windows starting at
+    # 1.5s and 2.25s hear nothing
+    wav = 0.5 * np.sin(2 * np.pi * 440 * np.arange(6 * 16000) / 16000)
+    wav[24000:60000] = 0
+
+    segments = diarization.perform_diarization(Path("meeting.wav"), wav=wav, num_speakers=2)
+
+    window_starts = embed_windows.call_args.args[2]
+    # The last window ends exactly at the end of the recording
+    assert window_starts.tolist() == [0, 12000, 48000, 60000, 72000]
+    assert embed_windows.call_args.args[3] == 24000
+    assert [(segment.start, segment.end) for segment in segments] == [(0.0, 2.25), (3.0, 6.0)]
+    assert segments[0].speaker != segments[1].speaker
+
+
+def test_diarization_keeps_pauses_in_preloaded_audio(mocker):
+    pytest.importorskip("resemblyzer")
+    pytest.importorskip("sklearn")
+    mocker.patch.object(diarization, "get_voice_encoder")
+    rng = np.random.default_rng(0)
+    speakers = rng.standard_normal((2, 256))
+    embed_windows = mocker.patch.object(
+        diarization,
+        "_embed_windows",
+        return_value=speakers[[0, 0, 0, 0, 1, 1, 1, 1]] + 0.01 * rng.standard_normal((8, 256)),
+    )
+    # 9 seconds of tone with a 3 second pause, which resemblyzer's
+    # preprocess_wav would trim, moving the second speaker's turn earlier
+    wav = 0.5 * np.sin(2 * np.pi * 440 * np.arange(9 * 16000) / 16000)
+    wav[48000:96000] = 0
+
+    segments = diarization.perform_diarization(Path("meeting.wav"), wav=wav, num_speakers=2)
+
+    assert len(embed_windows.call_args.args[1]) == len(wav)
+    assert embed_windows.call_args.args[2].tolist() == [0, 12000, 24000, 36000, 84000, 96000, 108000, 120000]
+    assert [(segment.start, segment.end) for segment in segments] == [(0.0, 3.75), (5.25, 9.0)]
+
+
+def test_diarization_stops_when_cancelled(mocker):
+    pytest.importorskip("sklearn")
+    stub_resemblyzer(mocker)
+    mocker.patch.object(diarization, "get_voice_encoder")
+    embed_windows = mocker.patch.object(
+        diarization, "_embed_windows", return_value=np.random.default_rng(0).standard_normal((7, 256))
+    )
+    estimate_num_speakers = mocker.patch.object(diarization, "_estimate_num_speakers")
+    spectral_clustering = mocker.patch.object(diarization, "_spectral_clustering")
+    wav = 0.5 * np.sin(2 * np.pi * 440 * np.arange(6 * 16000) / 16000)
+
+    # The job is cancelled while the windows are being embedded
+    with pytest.raises(TranscriptionCancelledError):
+        diarization.perform_diarization(Path("meeting.wav"), wav=wav, cancellation_checker=lambda: embed_windows.called)
+
+    estimate_num_speakers.assert_not_called()
+    spectral_clustering.assert_not_called()
+
+
+def test_voice_encoder_is_loaded_once(mocker):
+    voice_encoder = mocker.Mock()
+    mocker.patch.dict("sys.modules", {"resemblyzer": SimpleNamespace(VoiceEncoder=voice_encoder)})
+    mocker.patch.object(diarization, "_configure_torch")
+    mocker.patch.object(diarization, "_voice_encoder", None)
+
+    first = diarization.get_voice_encoder()
+    second = diarization.get_voice_encoder()
+
+    assert first is second
+    voice_encoder.assert_called_once()
@@ -0,0 +1,29 @@
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+
+from common import logger
+
+
+@pytest.fixture
+def restore_root_logger():
+    root_logger = logging.getLogger()
+    handlers = list(root_logger.handlers)
+    yield root_logger
+    logger._stop_log_listener()  # noqa: SLF001
+    root_logger.handlers[:] = handlers
+
+
+def test_setup_logger_writes_through_queue(tmp_path, restore_root_logger):
+    log_file = tmp_path / "logs" / "app.log"
+
+    logger.setup_logger(log_file_path=str(log_file))
+    logger.setup_logger(log_file_path=str(log_file))
+    logging.getLogger("test").info("hello from the queue")
+    logger._stop_log_listener()  # noqa: SLF001
+
+    assert [type(handler) for handler in restore_root_logger.handlers] == [QueueHandler]
+    lines = log_file.read_text().splitlines()
+    assert lines[-1].endswith("test - INFO - hello from the queue")
+    assert sum("hello from the queue" in line for line in lines) == 1
@@ -0,0 +1,93 @@
+import json
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from common.llm.adapters import OllamaModelAdapter, close_ollama_clients
+
+
+class House(BaseModel):
+    color: str
+    bedrooms: int
+
+
+def make_adapter(handler) -> OllamaModelAdapter:
+    adapter = OllamaModelAdapter(model="llama3.2", base_url="http://ollama:11434")
+    adapter._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))  # noqa: SLF001
+    return adapter
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_adapters_share_http_client():
+    adapter_1 = OllamaModelAdapter(model="llama3.2", base_url="http://ollama:11434")
+    adapter_2 = OllamaModelAdapter(model="qwen2.5:32b", base_url="http://ollama:11434")
+    other_server = OllamaModelAdapter(model="llama3.2", base_url="http://localhost:11434")
+
+    assert adapter_1._client is adapter_2._client  # noqa: SLF001
+    assert adapter_1._client is not other_server._client  # noqa: SLF001
+
+    await close_ollama_clients()
+    assert adapter_1._client.is_closed  # noqa: SLF001
+
+    new_adapter = OllamaModelAdapter(model="llama3.2", base_url="http://ollama:11434")
+    assert not new_adapter._client.is_closed  # noqa: SLF001
+    await close_ollama_clients()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_chat_accumulates_streamed_response():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        lines = [
+            {"message": {"role": "assistant", "content": "Hello"}, "done": False},
+            {"message": {"role": "assistant", "content": " John"}, "done": False},
+            {"message": {"role": "assistant", "content": ""}, "done": True},
+        ]
+        return httpx.Response(200, content="\n".join(json.dumps(line) for line in lines))
+
+    adapter = make_adapter(handler)
+
+    result = await adapter.chat([{"role": "user", "content": "Hello my name is John."}])
+
+    assert result == "Hello John"
+    assert requests[0]["stream"] is True
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_chat_raises_streamed_error():
+    def handler(request: httpx.Request) -> httpx.Response:  # noqa: ARG001
+        lines = [
+            {"message": {"role": "assistant", "content": "Hello"}, "done": False},
+            {"error": "model runner has unexpectedly stopped"},
+        ]
+        return httpx.Response(200, content="\n".join(json.dumps(line) for line in lines))
+
+    adapter = make_adapter(handler)
+
+    with pytest.raises(RuntimeError, match="model runner has unexpectedly stopped"):
+        await adapter.chat([{"role": "user", "content": "Hello my name is John."}])
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_structured_chat_sends_json_schema():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        content = json.dumps({"color": "red", "bedrooms": 3})
+        return httpx.Response(200, json={"message": {"role": "assistant", "content": content}})
+
+    adapter = make_adapter(handler)
+
+    result = await adapter.structured_chat([{"role": "user", "content": "The house is red with 3 bedrooms."}], House)
+
+    assert result == House(color="red", bedrooms=3)
+    system_message = requests[0]["messages"][0]
+    assert system_message["role"] == "system"
+    schema = system_message["content"].split("```json\n")[1].split("\n```")[0]
+    assert json.loads(schema) == House.model_json_schema()
+    assert ", " not in schema
+    assert ": " not in schema
@@ -0,0 +1,96 @@
+import httpx
+import pytest
+
+from backend.api.routes import status
+from backend.api.routes.status import ConfigurationInfo, ServiceStatus, SystemStatusResponse
+
+
+def make_status_response(ollama_status: str = "healthy") -> SystemStatusResponse:
+    return SystemStatusResponse(
+        timestamp="2024-01-01T00:00:00",
+        services=[
+            ServiceStatus(name="Backend", status="healthy"),
+            ServiceStatus(name="Ollama", status=ollama_status),
+        ],
+        models=[],
+        configuration=ConfigurationInfo(
+            environment="local",
+            whisper_model="large-v3",
+            whisper_device="cpu",
+            storage_service="local",
+            transcription_services=["whisper_local"],
+        ),
+    )
+
+
+@pytest.fixture
+def fake_build_system_status(mocker):
+    mocker.patch.object(status, "_status_cache", None)
+    calls = []
+
+    async def fake(settings):  # noqa: ARG001
+        calls.append(1)
+        return make_status_response()
+
+    mocker.patch.object(status, "build_system_status", side_effect=fake)
+    return calls
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_status_is_cached(fake_build_system_status):
+    first = await status.get_system_status(refresh=False)
+    second = await status.get_system_status(refresh=False)
+
+    assert first is second
+    assert len(fake_build_system_status) == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_status_refresh_bypasses_cache(fake_build_system_status):
+    await status.get_system_status(refresh=False)
+    await status.get_system_status(refresh=True)
+
+    assert len(fake_build_system_status) == 2
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_unhealthy_status_uses_short_ttl(mocker):
+    mocker.patch.object(status, "_status_cache", None)
+    mocker.patch.object(status, "build_system_status", return_value=make_status_response(ollama_status="unhealthy"))
+
+    before = status.time.monotonic()
+    await status.get_system_status(refresh=False)
+    after = status.time.monotonic()
+
+    expires_at, _ = status._status_cache  # noqa: SLF001
+    assert before + status.STATUS_ERROR_CACHE_TTL_SECONDS <= expires_at <= after + status.STATUS_ERROR_CACHE_TTL_SECONDS
+
+
+def test_configuration_is_cached():
+    assert status.get_configuration() is status.get_configuration()
+
+
+def test_transcription_services_parsed_from_environment(mocker):
+    mocker.patch.dict("os.environ", {"TRANSCRIPTION_SERVICES": '["whisper_local", "azure_stt_synchronous"]'})
+    assert status._parse_transcription_services() == ["whisper_local", "azure_stt_synchronous"]  # noqa: SLF001
+
+    mocker.patch.dict("os.environ", {"TRANSCRIPTION_SERVICES": "whisper_local"})
+    assert status._parse_transcription_services() == ["whisper_local"]  # noqa: SLF001
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_ollama_status_matches_model_names(mocker):
+    mocker.patch.object(status.settings, "FAST_LLM_MODEL_NAME", "llama3.2")
+    mocker.patch.object(status.settings, "BEST_LLM_MODEL_NAME", "qwen2.5:32b")
+
+    def handler(request: httpx.Request) -> httpx.Response:  # noqa: ARG001
+        return httpx.Response(200, json={"models": [{"name": "llama3.2:latest"}, {"name": "mistral:7b"}]})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        service, models = await status.check_ollama_status(status.settings, client)
+
+    assert service.status == "healthy"
+    assert [(model.name, model.status, model.role) for model in models] == [
+        ("llama3.2", "loaded", "fast"),
+        ("qwen2.5:32b", "unavailable", "best"),
+    ]
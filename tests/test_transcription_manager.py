@@ -1,6 +1,6 @@
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -181,6 +181,18 @@ class TestTranscriptionServiceManager:
         with pytest.raises(RuntimeError, match="No transcription services are available"):
             manager.select_adaptor(5000)  # Exceeds all adapters' max length
 
+    @pytest.mark.asyncio
+    async def test_warmup_available_adapters(self, manager, mock_adapters):
+        """Test warmup only warms up the available adapters."""
+        for adapter in mock_adapters.values():
+            adapter.warmup = AsyncMock()
+
+        await manager.warmup()
+
+        mock_adapters["MockAdapter1"].warmup.assert_awaited_once()
+        mock_adapters["MockAdapter2"].warmup.assert_awaited_once()
+        mock_adapters["MockAdapter3"].warmup.assert_not_awaited()
+
     @pytest.mark.asyncio
     @patch("common.services.transcription_services.transcription_manager.convert_american_to_british_spelling")
     async def test_check_transcription_success(self, mock_convert_spelling, manager, sample_message_data):
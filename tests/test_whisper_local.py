@@ -0,0 +1,264 @@
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from common.audio.diarization import SpeakerSegment
+from common.services.exceptions import TranscriptionCancelledError
+from common.services.transcription_services import whisper_local
+from common.services.transcription_services.whisper_local import WhisperLocalAdapter
+
+
+@pytest.fixture
+def whisper_model(mocker):
+    pytest.importorskip("faster_whisper")
+    mocker.patch.object(WhisperLocalAdapter, "_models", {})
+    return mocker.patch.object(whisper_local, "WhisperModel")
+
+
+@pytest.fixture
+def batched_pipeline(mocker, whisper_model):  # noqa: ARG001
+    mocker.patch.object(whisper_local, "decode_audio", return_value=np.zeros(4 * 16000, dtype=np.float32))
+    mocker.patch.object(WhisperLocalAdapter, "_detect_speech", return_value=[{"start": 8000, "end": 4 * 16000}])
+    pipeline = mocker.patch.object(whisper_local, "BatchedInferencePipeline")
+    segments = [
+        SimpleNamespace(start=0.0, end=2.5, text=" Hello there. "),
+        SimpleNamespace(start=2.5, end=4.0, text=" General Kenobi."),
+    ]
+    info = SimpleNamespace(language="en", language_probability=0.99)
+    pipeline.return_value.transcribe.return_value = (iter(segments), info)
+    return pipeline
+
+
+def test_model_is_loaded_once(whisper_model):
+    first = WhisperLocalAdapter._get_model()  # noqa: SLF001
+    second = WhisperLocalAdapter._get_model()  # noqa: SLF001
+
+    assert first is second
+    whisper_model.assert_called_once()
+
+
+@pytest.mark.parametrize(("device", "compute_type"), [("cuda", "int8_float16"), ("cpu", "int8")])
+def test_model_compute_type_defaults_to_int8(mocker, whisper_model, device, compute_type):
+    mocker.patch.object(whisper_local.settings, "WHISPER_DEVICE", device)
+    mocker.patch.object(whisper_local.settings, "WHISPER_COMPUTE_TYPE", None)
+
+    WhisperLocalAdapter._get_model()  # noqa: SLF001
+
+    assert whisper_model.call_args.kwargs["compute_type"] == compute_type
+
+
+@pytest.mark.parametrize(
+    ("requested", "supported", "compute_type"),
+    [
+        (None, {"float32", "float16", "int8", "int8_float16"}, "int8_float16"),
+        (None, {"float32", "float16"}, "float16"),
+        ("float16", {"float32", "float16", "int8", "int8_float16"}, "float16"),
+        ("bfloat16", {"float32", "float16"}, "float16"),
+    ],
+)
+def test_model_compute_type_falls_back_to_supported(mocker, whisper_model, requested, supported, compute_type):
+    mocker.patch.object(whisper_local.settings, "WHISPER_DEVICE", "cuda")
+    mocker.patch.object(whisper_local.settings, "WHISPER_COMPUTE_TYPE", requested)
+    mocker.patch.object(whisper_local, "_supported_compute_types", return_value=frozenset(supported))
+
+    WhisperLocalAdapter._get_model()  # noqa: SLF001
+
+    assert whisper_model.call_args.kwargs["compute_type"] == compute_type
+
+
+def test_model_cpu_threads_default_to_physical_cores(mocker, whisper_model):
+    mocker.patch.object(whisper_local.settings, "WHISPER_DEVICE", "cpu")
+    mocker.patch.object(whisper_local.settings, "WHISPER_CPU_THREADS", None)
+    mocker.patch.object(whisper_local.settings, "MAX_TRANSCRIPTION_PROCESSES", 2)
+    mocker.patch("os.sched_getaffinity", return_value=set(range(16)), create=True)
+    mocker.patch("os.cpu_count", return_value=64)
+
+    WhisperLocalAdapter._get_model()  # noqa: SLF001
+
+    assert whisper_model.call_args.kwargs["cpu_threads"] == 4
+    assert "device_index" not in whisper_model.call_args.kwargs
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_start_transcribes_in_batches(mocker, batched_pipeline):
+    mocker.patch.object(whisper_local.settings, "WHISPER_BATCH_SIZE", 8)
+    mocker.patch.object(whisper_local.settings, "ENABLE_SPEAKER_DIARIZATION", False)
+
+    result = await WhisperLocalAdapter.start(Path("meeting.wav"))
+
+    transcribe_args = batched_pipeline.return_value.transcribe.call_args
+    assert transcribe_args.args[0].shape == (4 * 16000,)
+    transcribe_kwargs = transcribe_args.kwargs
+    assert transcribe_kwargs["batch_size"] == 8
+    assert transcribe_kwargs["beam_size"] == 1
+    assert transcribe_kwargs["clip_timestamps"] == [{"start": 0.5, "end": 4.0}]
+    assert result.transcript == [
+        {"speaker": "Speaker 1", "text": "Hello there.", "start_time": 0.0, "end_time": 2.5},
+        {"speaker": "Speaker 1", "text": "General Kenobi.", "start_time": 2.5, "end_time": 4.0},
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_start_transcribes_with_timestamps(mocker, batched_pipeline):
+    mocker.patch.object(whisper_local.settings, "ENABLE_SPEAKER_DIARIZATION", False)
+
+    await WhisperLocalAdapter.start(Path("meeting.wav"))
+
+    # Without timestamps, the pipeline returns each clip of up to 30 seconds
+    # as a single segment, so speaker turns within it are lost
+    assert batched_pipeline.return_value.transcribe.call_args.kwargs["without_timestamps"] is False
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_start_labels_speakers(mocker, batched_pipeline):  # noqa: ARG001
+    mocker.patch.object(whisper_local.settings, "ENABLE_SPEAKER_DIARIZATION", True)
+    perform_diarization = mocker.patch(
+        "common.audio.diarization.perform_diarization",
+        return_value=[
+            SpeakerSegment(start=0.0, end=2.1, speaker="SPEAKER_01"),
+            SpeakerSegment(start=2.1, end=3.5, speaker="SPEAKER_00"),
+        ],
+    )
+
+    result = await WhisperLocalAdapter.start(Path("meeting.wav"))
+
+    assert perform_diarization.call_args.kwargs["wav"].shape == (4 * 16000 - 8000,)
+    assert [entry["speaker"] for entry in result.transcript] == ["Speaker 2", "Speaker 1"]
+    assert [entry["text"] for entry in result.transcript] == ["Hello there.", "General Kenobi."]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_start_diarizes_while_transcribing(mocker, batched_pipeline):
+    mocker.patch.object(whisper_local.settings, "ENABLE_SPEAKER_DIARIZATION", True)
+    diarization_started = threading.Event()
+
+    def perform_diarization(*args, **kwargs):  # noqa: ARG001
+        diarization_started.set()
+        return [SpeakerSegment(start=0.0, end=3.5, speaker="SPEAKER_00")]
+
+    def segments():
+        # Transcription can only finish if diarization runs alongside it
+        assert diarization_started.wait(timeout=5)
+        yield SimpleNamespace(start=0.0, end=2.5, text=" Hello there. ")
+
+    mocker.patch("common.audio.diarization.perform_diarization", side_effect=perform_diarization)
+    info = SimpleNamespace(language="en", language_probability=0.99)
+    batched_pipeline.return_value.transcribe.return_value = (segments(), info)
+
+    result = await WhisperLocalAdapter.start(Path("meeting.wav"))
+
+    assert [entry["speaker"] for entry in result.transcript] == ["Speaker 1"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_stream_yields_segments(batched_pipeline):  # noqa: ARG001
+    stream = WhisperLocalAdapter.stream(Path("meeting.wav"))
+
+    first = await anext(stream)
+    assert first == {"speaker": "Speaker 1", "text": "Hello there.", "start_time": 0.0, "end_time": 2.5}
+    assert [entry async for entry in stream] == [
+        {"speaker": "Speaker 1", "text": "General Kenobi.", "start_time": 2.5, "end_time": 4.0},
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_start_stops_when_cancelled(batched_pipeline):
+    segments = [SimpleNamespace(start=float(i), end=i + 1.0, text="words") for i in range(20)]
+    info = SimpleNamespace(language="en", language_probability=0.99)
+    batched_pipeline.return_value.transcribe.return_value = (iter(segments), info)
+
+    with pytest.raises(TranscriptionCancelledError):
+        await WhisperLocalAdapter.start(Path("meeting.wav"), cancellation_checker=lambda: True)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_start_stops_diarization_when_cancelled(mocker, batched_pipeline):
+    mocker.patch.object(whisper_local.settings, "ENABLE_SPEAKER_DIARIZATION", True)
+    diarization_started = threading.Event()
+    diarization_stopped = threading.Event()
+
+    def perform_diarization(*args, **kwargs):  # noqa: ARG001
+        diarization_started.set()
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if kwargs["cancellation_checker"]():
+                diarization_stopped.set()
+                msg = "Diarization was cancelled"
+                raise TranscriptionCancelledError(msg)
+            time.sleep(0.01)
+        return []
+
+    def segments():
+        assert diarization_started.wait(timeout=5)
+        for i in range(20):
+            yield SimpleNamespace(start=float(i), end=i + 1.0, text="words")
+
+    mocker.patch("common.audio.diarization.perform_diarization", side_effect=perform_diarization)
+    info = SimpleNamespace(language="en", language_probability=0.99)
+    batched_pipeline.return_value.transcribe.return_value = (segments(), info)
+
+    with pytest.raises(TranscriptionCancelledError):
+        await WhisperLocalAdapter.start(Path("meeting.wav"), cancellation_checker=lambda: True)
+
+    # The diarization thread has finished, rather than being left running
+    assert diarization_stopped.is_set()
+
+
+def test_silence_is_not_transcribed(mocker):
+    get_model = mocker.patch.object(WhisperLocalAdapter, "_get_model")
+    audio = np.zeros(5 * 16000, dtype=np.float32)
+
+    speech = WhisperLocalAdapter._detect_speech(audio)  # noqa: SLF001
+    segments = WhisperLocalAdapter._transcribe(audio, speech)  # noqa: SLF001
+
+    assert speech == []
+    assert list(segments) == []
+    get_model.assert_not_called()
+
+
+def test_speech_is_merged_into_whisper_windows():
+    speech = [
+        {"start": 0, "end": 10 * 16000},
+        {"start": 12 * 16000, "end": 25 * 16000},
+        {"start": 29 * 16000, "end": 35 * 16000},
+        {"start": 36 * 16000, "end": 40 * 16000},
+    ]
+
+    clips = WhisperLocalAdapter._merge_speech(speech)  # noqa: SLF001
+
+    assert clips == [{"start": 0.0, "end": 25.0}, {"start": 29.0, "end": 40.0}]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_warmup_transcribes_silence(mocker, batched_pipeline):
+    mocker.patch.object(whisper_local.settings, "ENABLE_SPEAKER_DIARIZATION", False)
+
+    await WhisperLocalAdapter.warmup()
+
+    transcribe_args = batched_pipeline.return_value.transcribe.call_args
+    assert transcribe_args.args[0].shape == (16000,)
+    assert transcribe_args.kwargs["clip_timestamps"] == [{"start": 0.0, "end": 1.0}]
+    assert WhisperLocalAdapter._models  # noqa: SLF001
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_warmup_failure_is_not_raised(whisper_model):
+    whisper_model.side_effect = RuntimeError("CUDA out of memory")
+
+    await WhisperLocalAdapter.warmup()
+
+
+def test_diarization_availability_is_checked_once(mocker):
+    find_spec = mocker.patch.object(whisper_local, "find_spec", return_value=None)
+    whisper_local._diarization_dependencies_installed.cache_clear()  # noqa: SLF001
+
+    try:
+        assert not WhisperLocalAdapter.is_diarization_available()
+        assert not WhisperLocalAdapter.is_diarization_available()
+        find_spec.assert_called_once_with("resemblyzer")
+    finally:
+        whisper_local._diarization_dependencies_installed.cache_clear()  # noqa: SLF001
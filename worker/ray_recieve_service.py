@@ -4,6 +4,7 @@ from typing import Any
 
 import ray
 
+from common.llm.adapters import close_ollama_clients
 from common.services.exceptions import InteractionFailedError, TranscriptionFailedError
 from common.services.minute_handler_service import MinuteGenerationFailedError, MinuteHandlerService
 from common.services.queue_services.base import QueueService
@@ -45,6 +46,7 @@ class RayTranscriptionService:
         logger.info("Ray Transcription receive service initialised")
 
     async def process(self) -> None:
+        await TranscriptionHandlerService.warmup()
         while not await self.stopped.get.remote():
             logger.info("Receiving transcription messages")
             messages = self.transcription_queue_service.receive_message(max_messages=1)
@@ -74,6 +76,8 @@ class RayTranscriptionService:
                 self.transcription_queue_service.complete_message(receipt_handle)
             self.heartbeat_path.touch()
 
+        await close_ollama_clients()
+
 
 @ray.remote(max_restarts=-1, max_task_retries=0)
 class RayLlmService:
@@ -112,6 +116,8 @@ class RayLlmService:
 
             self.heartbeat_path.touch()
 
+        await close_ollama_clients()
+
     async def process_minute_task(self, message: WorkerMessage, receipt_handle: Any) -> None:
         try:
             logger.info("Received minute generation message for MinuteVersion id %s", message.id)